@@ -20,7 +20,7 @@ from blogmore.generator.paths import (
 )
 from blogmore.image_manager import ImageManager
 from blogmore.parser import PostParser
-from blogmore.renderer import TemplateRenderer
+from blogmore.renderer import TemplateRenderer, clear_environment_cache
 from blogmore.utils import get_blog_cache_dir, timed_step
 
 if TYPE_CHECKING:
@@ -79,6 +79,9 @@ class SiteGenerator:
 
     def generate(self) -> None:
         """Generate the complete static site."""
+        # Start each build with fresh template environments, so custom
+        # templates added since the last build are found.
+        clear_environment_cache()
         self._initialize_components()
 
         # Define local expanded paths for the build pass
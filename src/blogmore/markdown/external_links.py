@@ -8,6 +8,49 @@ from markdown.extensions import Extension
 from markdown.treeprocessors import Treeprocessor
 
 
+def internal_domains(site_domain: str | None) -> frozenset[str]:
+    """Work out every domain that counts as internal to a site.
+
+    Args:
+        site_domain: The lower-cased domain of the site, if known.
+
+    Returns:
+        The site's domain and its `www.` form, or an empty set if the
+        domain isn't known.
+    """
+    return (
+        frozenset({site_domain, f"www.{site_domain}"}) if site_domain else frozenset()
+    )
+
+
+def is_external_link(href: str, internal: frozenset[str]) -> bool:
+    """Determine if a link is external to a site.
+
+    Args:
+        href: The href attribute value.
+        internal: The domains internal to the site, as made by
+            `internal_domains`.
+
+    Returns:
+        True if the link is external, False otherwise.
+    """
+    # Empty links, and relative links (starting with /, #, or no scheme),
+    # are internal
+    if not href or href.startswith(("/", "#")):
+        return False
+
+    # Parse the URL
+    parsed = urlparse(href)
+
+    # If there's no scheme or netloc, it's a relative link (internal)
+    if not parsed.scheme and not parsed.netloc:
+        return False
+
+    # Links to the site's own domain are internal; all other links with
+    # schemes are external.
+    return parsed.netloc.lower() not in internal
+
+
 class ExternalLinksProcessor(Treeprocessor):
     """Tree processor that adds target="_blank" to external links."""
 
@@ -27,6 +70,9 @@ class ExternalLinksProcessor(Treeprocessor):
             self.site_domain = parsed.netloc.lower()
         else:
             self.site_domain = None
+        # Work out, once, every domain that counts as internal, so that
+        # checking each link is a single set lookup.
+        self._internal_domains = internal_domains(self.site_domain)
 
     def run(self, root: Element) -> Element | None:
         """Process all anchor tags in the element tree.
@@ -37,23 +83,10 @@ class ExternalLinksProcessor(Treeprocessor):
         Returns:
             The modified root element or None
         """
-        self._process_element(root)
+        for anchor in root.iter("a"):
+            self._process_link(anchor)
         return None
 
-    def _process_element(self, element: Element) -> None:
-        """Recursively process an element and its children.
-
-        Args:
-            element: The element to process
-        """
-        # Process current element if it's an anchor tag
-        if element.tag == "a":
-            self._process_link(element)
-
-        # Recursively process all children
-        for child in element:
-            self._process_element(child)
-
     def _process_link(self, element: Element) -> None:
         """Process a link element to determine if it's external.
 
@@ -82,29 +115,7 @@ class ExternalLinksProcessor(Treeprocessor):
         Returns:
             True if the link is external, False otherwise
         """
-        # Relative links (starting with /, #, or no scheme) are internal
-        if href.startswith("/") or href.startswith("#"):
-            return False
-
-        # Parse the URL
-        parsed = urlparse(href)
-
-        # If there's no scheme or netloc, it's a relative link (internal)
-        if not parsed.scheme and not parsed.netloc:
-            return False
-
-        # If we have a site domain, check if the link matches
-        if self.site_domain:
-            link_domain = parsed.netloc.lower()
-            # If domains match, it's internal
-            if (
-                link_domain == self.site_domain
-                or link_domain == f"www.{self.site_domain}"
-            ):
-                return False
-
-        # All other links with schemes are external
-        return True
+        return is_external_link(href, self._internal_domains)
 
 
 class ExternalLinksExtension(Extension):
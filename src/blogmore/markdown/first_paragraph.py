@@ -12,6 +12,9 @@ from html.parser import HTMLParser
 
 __all__ = ["extract_first_paragraph_from_html"]
 
+_WHITESPACE = re.compile(r"\s+")
+"""Pattern that matches a run of whitespace to be collapsed to a single space."""
+
 
 class _FirstParagraphExtractor(HTMLParser):
     """HTML parser that extracts plain text from the first non-image-only paragraph.
@@ -103,7 +106,7 @@ class _FirstParagraphExtractor(HTMLParser):
                 self._block_depth -= 1
         elif tag == "p" and self._in_paragraph:
             self._in_paragraph = False
-            text = re.sub(r"\s+", " ", "".join(self._chunks)).strip()
+            text = _WHITESPACE.sub(" ", "".join(self._chunks)).strip()
             if self._has_text and text:
                 self._result = text
                 self._done = True
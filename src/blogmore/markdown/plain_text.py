@@ -24,6 +24,9 @@ from blogmore.markdown import create_custom_extensions
 # allowing for instance reuse via .reset().
 _thread_local = threading.local()
 
+_WHITESPACE = re.compile(r"\s+")
+"""Pattern that matches a run of whitespace to be collapsed to a single space."""
+
 
 def get_plain_text_markdown_instance() -> markdown.Markdown:
     """Get a thread-local Markdown instance suitable for plain-text extraction.
@@ -81,7 +84,7 @@ class TextExtractor(HTMLParser):
             Plain-text content with all whitespace runs normalised to a
             single space and leading/trailing whitespace removed.
         """
-        return re.sub(r"\s+", " ", "".join(self._chunks)).strip()
+        return _WHITESPACE.sub(" ", "".join(self._chunks)).strip()
 
 
 class TextSansCodeExtractor(TextExtractor):
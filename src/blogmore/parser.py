@@ -1,11 +1,12 @@
 """Markdown parser with frontmatter support for blog posts."""
 
 import datetime as dt
+import os
 import re
 import threading
-from collections.abc import Generator
+from collections.abc import Generator, Iterator
 from dataclasses import dataclass, field
-from functools import cached_property
+from functools import cached_property, lru_cache
 from pathlib import Path
 from typing import Any, cast
 
@@ -89,9 +90,14 @@ class _LangAwareHtmlFormatter(HtmlFormatter[str]):
         yield 0, "</div>\n"
 
 
+@lru_cache(maxsize=4096)
 def sanitize_for_url(value: str) -> str:
     """Sanitize a string for safe use in URLs and filenames.
 
+    Tags and categories are shared across many posts, so the result is
+    cached. The cache is bounded, as it lives as long as the process does,
+    which in serve mode spans many builds.
+
     Args:
         value: The string to sanitize
 
@@ -121,6 +127,35 @@ def remove_date_prefix(slug: str) -> str:
     return re.sub(r"^\d{4}-\d{2}-\d{2}-", "", slug)
 
 
+def parse_date_string(value: str) -> dt.datetime | None:
+    """Parse a date string from frontmatter into a datetime.
+
+    ISO 8601 strings, which is what nearly all frontmatter dates are, are
+    handled by the C-implemented `datetime.fromisoformat`. Anything it
+    rejects is tried against the more lenient common formats, and then
+    finally handed to python-dateutil.
+
+    Args:
+        value: The date string to parse
+
+    Returns:
+        The parsed datetime, or None if the string could not be parsed
+    """
+    try:
+        return dt.datetime.fromisoformat(value)
+    except ValueError:
+        pass
+    for fmt in _DATE_FORMATS:
+        try:
+            return dt.datetime.strptime(value, fmt)
+        except ValueError:
+            continue
+    try:
+        return dateutil_parser.parse(value)
+    except ValueError:
+        return None
+
+
 @dataclass
 class Post:
     """Represents a blog post with metadata and content."""
@@ -156,6 +191,19 @@ class Post:
         """
         if self.url_path is not None:
             return self.url_path
+        return self._default_url
+
+    @cached_property
+    def _default_url(self) -> str:
+        """The URL path for the post under the default URL scheme.
+
+        This is cached, as a post's URL is asked for many times during a
+        build. `url_path` is deliberately not part of this, as the
+        generator sets it after the post has been parsed.
+
+        Returns:
+            The default URL path for the post, always beginning with `/`.
+        """
         if self.date:
             # Extract date components
             year = self.date.year
@@ -233,15 +281,7 @@ class Post:
         if isinstance(modified, dt.date):
             return dt.datetime.combine(modified, dt.time())
         if isinstance(modified, str):
-            for fmt in _DATE_FORMATS:
-                try:
-                    return dt.datetime.strptime(modified, fmt)
-                except ValueError:
-                    continue
-            try:
-                return dateutil_parser.parse(modified)
-            except ValueError:
-                pass
+            return parse_date_string(modified)
         return None
 
 
@@ -257,11 +297,12 @@ def post_sort_key(post: Post) -> float:
     Returns:
         A float sort key derived from the post date
     """
-    if post.date is None:
+    date = post.date
+    if date is None:
         return 0.0
-    if post.date.tzinfo:
-        return post.date.timestamp()
-    return post.date.replace(tzinfo=dt.UTC).timestamp()
+    if date.tzinfo is None:
+        date = date.replace(tzinfo=dt.UTC)
+    return date.timestamp()
 
 
 @dataclass
@@ -311,6 +352,46 @@ class Page:
         return extract_first_paragraph_from_html(self.html_content)
 
 
+def _find_markdown_files(
+    directory: Path, resolved_directory: Path, exclude_dirs: frozenset[Path]
+) -> Iterator[Path]:
+    """Recursively find the Markdown files below a directory.
+
+    Excluded directories are pruned as they are found, so nothing below them
+    is ever scanned. Symlinked directories are not followed, matching the
+    behaviour of `Path.rglob`. Symlinked files are resolved and skipped if
+    they point into an excluded directory, and the `.md` suffix is matched
+    with the platform's case sensitivity, again as `Path.rglob` does.
+
+    Args:
+        directory: The directory to search.
+        resolved_directory: The resolved form of `directory`, used to test
+            subdirectories against `exclude_dirs`.
+        exclude_dirs: Resolved paths of directories to skip.
+
+    Yields:
+        The path of each Markdown file found, relative to `directory` in the
+        same way `Path.rglob` would report it.
+    """
+    subdirectories: list[str] = []
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                subdirectories.append(entry.name)
+            elif os.path.normcase(entry.name).endswith(".md"):
+                if entry.is_symlink() and any(
+                    Path(entry.path).resolve().is_relative_to(excluded)
+                    for excluded in exclude_dirs
+                ):
+                    continue
+                yield directory / entry.name
+    for name in subdirectories:
+        if (resolved_subdirectory := resolved_directory / name) not in exclude_dirs:
+            yield from _find_markdown_files(
+                directory / name, resolved_subdirectory, exclude_dirs
+            )
+
+
 # Thread-local storage for Markdown instances to ensure thread-safety while
 # allowing for instance reuse via .reset().
 _thread_local = threading.local()
@@ -463,20 +544,7 @@ class PostParser:
                 # Convert date to datetime
                 date = dt.datetime.combine(date_value, dt.time())
             elif isinstance(date_value, str):
-                # Try to parse common date formats, including timezone-aware formats
-                for fmt in _DATE_FORMATS:
-                    try:
-                        date = dt.datetime.strptime(date_value, fmt)
-                        break
-                    except ValueError:
-                        continue
-
-                # If we still couldn't parse it, try with python-dateutil if available
-                if date is None:
-                    try:
-                        date = dateutil_parser.parse(date_value)
-                    except ValueError:
-                        pass
+                date = parse_date_string(date_value)
 
         # Extract category - coerce to str in case YAML parsed it as a non-string
         # (e.g. `category: 2024` is parsed as int by the YAML parser)
@@ -554,15 +622,20 @@ class PostParser:
         if not directory.exists():
             raise FileNotFoundError(f"Directory not found: {directory}")
 
-        resolved_exclude_dirs = [d.resolve() for d in (exclude_dirs or [])]
+        resolved_directory = directory.resolve()
+        resolved_exclude_dirs = frozenset(
+            excluded.resolve() for excluded in (exclude_dirs or [])
+        )
 
-        posts = []
-        for md_file in directory.rglob("*.md"):
-            if any(
-                md_file.resolve().is_relative_to(excluded)
-                for excluded in resolved_exclude_dirs
-            ):
-                continue
+        posts: list[Post] = []
+        if any(
+            resolved_directory.is_relative_to(excluded)
+            for excluded in resolved_exclude_dirs
+        ):
+            return posts
+        for md_file in _find_markdown_files(
+            directory, resolved_directory, resolved_exclude_dirs
+        ):
             try:
                 post = self.parse_file(md_file)
                 if not post.draft or include_drafts:
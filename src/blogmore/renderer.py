@@ -1,6 +1,7 @@
 """Template rendering using Jinja2."""
 
 import datetime as dt
+from functools import cache, lru_cache, partial
 from pathlib import Path
 from typing import Any
 from urllib.parse import urlparse
@@ -9,13 +10,186 @@ from jinja2 import (
     BaseLoader,
     ChoiceLoader,
     Environment,
+    FileSystemBytecodeCache,
     FileSystemLoader,
     PackageLoader,
+    Template,
     select_autoescape,
 )
+from jinja2.bccache import Bucket
 from markupsafe import Markup
 
+from blogmore import __version__
+from blogmore.markdown.external_links import internal_domains, is_external_link
 from blogmore.parser import Page, Post
+from blogmore.utils import get_user_cache_dir
+
+
+def _time_of(date: dt.datetime) -> str:
+    """Format the time of a datetime as `HH:MM:SS`.
+
+    This is built directly from the time's fields, as it is formatted for
+    every date on every page and `strftime` has to parse its format each
+    time.
+
+    Args:
+        date: The datetime to format the time of.
+
+    Returns:
+        The formatted time.
+    """
+    return f"{date.hour:02d}:{date.minute:02d}:{date.second:02d}"
+
+
+def _timezone_of(date: dt.datetime) -> str:
+    """Format the timezone of a datetime, for showing after the time.
+
+    Args:
+        date: The datetime to format the timezone of.
+
+    Returns:
+        The timezone name (or `UTC` offset, if it has no name) with a
+        leading space, or an empty string if the datetime is naive.
+    """
+    if date.tzinfo is None:
+        return ""
+    # Get timezone name or offset
+    if tz_name := date.tzname():
+        return f" {tz_name}"
+    # With no name, use the offset
+    if tz_offset := date.strftime("%z"):
+        # Format as UTC+HH:MM or UTC-HH:MM
+        return f" UTC{tz_offset[0]}{tz_offset[1:3]}:{tz_offset[3:5]}"
+    return ""
+
+
+@lru_cache(maxsize=4096)
+def _format_date_with_links(
+    date: dt.datetime, tz_name: str | None, utc_offset: dt.timedelta | None
+) -> Markup:
+    """Format a datetime as HTML with archive links.
+
+    The result is cached, as the same dates get formatted over and over
+    (on the post itself, in every listing it appears in, in backlinks).
+    Aware datetimes compare equal when they are the same instant, even in
+    different timezones, so the timezone name and offset are part of the
+    cache key; they aren't otherwise used.
+
+    Args:
+        date: The datetime to format.
+        tz_name: The name of the timezone of the datetime.
+        utc_offset: The UTC offset of the datetime.
+
+    Returns:
+        Markup containing the formatted date HTML.
+    """
+    year = date.year
+    month = date.month
+    day = date.day
+
+    year_link = Markup(f'<a href="/{year}/">{year}</a>')
+    month_link = Markup(f'<a href="/{year}/{month:02d}/">{month:02d}</a>')
+    day_link = Markup(f'<a href="/{year}/{month:02d}/{day:02d}/">{day:02d}</a>')
+
+    return Markup(
+        f"{year_link}-{month_link}-{day_link} {_time_of(date)}{_timezone_of(date)}"
+    )
+
+
+class _TemplateBytecodeCache(FileSystemBytecodeCache):
+    """A filesystem cache of compiled templates that never fails a build."""
+
+    def dump_bytecode(self, bucket: Bucket) -> None:
+        """Write the compiled template to the cache, if possible.
+
+        Args:
+            bucket: The bucket holding the compiled template.
+        """
+        try:
+            super().dump_bytecode(bucket)
+        except OSError:
+            # The cache is only an optimisation; if it can't be written
+            # (for example, it was cleared mid-build) just carry on.
+            pass
+
+
+def _template_bytecode_cache() -> FileSystemBytecodeCache | None:
+    """Get the cache for compiled templates.
+
+    The cache lives in the user's cache directory, keyed on the version of
+    blogmore, so later builds can skip compiling templates that haven't
+    changed.
+
+    Returns:
+        The bytecode cache, or `None` if the cache directory can't be made.
+    """
+    cache_dir = get_user_cache_dir() / "templates" / __version__
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+    except OSError:
+        return None
+    return _TemplateBytecodeCache(str(cache_dir))
+
+
+@cache
+def _create_environment(
+    templates_dir: Path | None, site_domain: str | None
+) -> Environment:
+    """Create the Jinja2 environment for the given settings.
+
+    Environments are cached, so every renderer created with the same
+    settings reuses the same environment and with it the templates it has
+    already compiled. The cache is cleared at the start of each build, with
+    `clear_environment_cache`, so custom templates added between rebuilds
+    in serve mode are picked up.
+
+    Args:
+        templates_dir: Optional path to a directory of custom templates.
+        site_domain: The lower-cased domain of the site, if known.
+
+    Returns:
+        The Jinja2 environment.
+    """
+    # Set up loaders: custom templates first (if provided), then bundled templates
+    loaders: list[BaseLoader] = []
+    if templates_dir is not None:
+        loaders.append(FileSystemLoader(str(templates_dir)))
+    # Always include bundled templates as fallback
+    loaders.append(PackageLoader("blogmore", "templates"))
+
+    env = Environment(
+        loader=ChoiceLoader(loaders),
+        autoescape=select_autoescape(["html", "xml"]),
+        trim_blocks=True,
+        lstrip_blocks=True,
+        bytecode_cache=_template_bytecode_cache(),
+    )
+
+    # Add custom filters
+    env.filters["format_date"] = TemplateRenderer._format_date
+    env.filters["format_date_plain"] = TemplateRenderer._format_date_plain
+    env.filters["is_external_link"] = partial(
+        is_external_link, internal=internal_domains(site_domain)
+    )
+
+    # Provide default values for pagination context variables so that
+    # templates rendering without a full generator context (e.g. tests)
+    # do not raise UndefinedError.
+    env.globals["pagination_page_urls"] = []
+    env.globals["pagination_page1_suffix"] = "index.html"
+
+    return env
+
+
+def clear_environment_cache() -> None:
+    """Forget the Jinja2 environments made so far.
+
+    A template first found in the bundled templates is only checked for
+    changes to that bundled file, so a cached environment would never see
+    a custom override of it added later. Clearing the cache at the start
+    of each build means every build looks for custom templates afresh.
+    """
+    _create_environment.cache_clear()
 
 
 class TemplateRenderer:
@@ -47,31 +221,16 @@ class TemplateRenderer:
             self.site_domain = parsed.netloc.lower()
         else:
             self.site_domain = None
+        self._internal_domains = internal_domains(self.site_domain)
 
-        # Set up loaders: custom templates first (if provided), then bundled templates
-        loaders: list[BaseLoader] = []
-        if templates_dir is not None:
-            loaders.append(FileSystemLoader(str(templates_dir)))
-        # Always include bundled templates as fallback
-        loaders.append(PackageLoader("blogmore", "templates"))
-
-        self.env = Environment(
-            loader=ChoiceLoader(loaders),
-            autoescape=select_autoescape(["html", "xml"]),
-            trim_blocks=True,
-            lstrip_blocks=True,
-        )
-
-        # Add custom filters
-        self.env.filters["format_date"] = self._format_date
-        self.env.filters["format_date_plain"] = self._format_date_plain
-        self.env.filters["is_external_link"] = self._is_external_link
+        # Renderers with the same settings share an environment, and so
+        # share its compiled templates.
+        self.env = _create_environment(templates_dir, self.site_domain)
 
-        # Provide default values for pagination context variables so that
-        # templates rendering without a full generator context (e.g. tests)
-        # do not raise UndefinedError.
-        self.env.globals["pagination_page_urls"] = []
-        self.env.globals["pagination_page1_suffix"] = "index.html"
+        # Templates this renderer has already looked up. A renderer only
+        # lives for one build, so this skips the environment's check that
+        # a template is still up to date on every page rendered.
+        self._templates: dict[str, Template] = {}
 
     @staticmethod
     def _format_date(date: dt.datetime | None) -> Markup:
@@ -89,34 +248,7 @@ class TemplateRenderer:
         """
         if date is None:
             return Markup("")
-
-        year = date.year
-        month = date.month
-        day = date.day
-
-        year_link = Markup(f'<a href="/{year}/">{year}</a>')
-        month_link = Markup(f'<a href="/{year}/{month:02d}/">{month:02d}</a>')
-        day_link = Markup(f'<a href="/{year}/{month:02d}/{day:02d}/">{day:02d}</a>')
-
-        time_str = date.strftime("%H:%M:%S")
-        formatted = Markup(f"{year_link}-{month_link}-{day_link} {time_str}")
-
-        # Add timezone information if available
-        if date.tzinfo is not None:
-            # Get timezone name or offset
-            tz_str = date.strftime("%Z")
-            if tz_str:
-                formatted = Markup(f"{formatted} {tz_str}")
-            else:
-                # If %Z doesn't work, use the offset
-                tz_offset = date.strftime("%z")
-                if tz_offset:
-                    # Format as UTC+HH:MM or UTC-HH:MM
-                    formatted = Markup(
-                        f"{formatted} UTC{tz_offset[0]}{tz_offset[1:3]}:{tz_offset[3:5]}"
-                    )
-
-        return formatted
+        return _format_date_with_links(date, date.tzname(), date.utcoffset())
 
     @staticmethod
     def _format_date_plain(date: dt.datetime | None) -> Markup:
@@ -135,22 +267,10 @@ class TemplateRenderer:
         if date is None:
             return Markup("")
 
-        time_str = date.strftime("%Y-%m-%d %H:%M:%S")
-        formatted = Markup(time_str)
-
-        # Add timezone information if available
-        if date.tzinfo is not None:
-            tz_str = date.strftime("%Z")
-            if tz_str:
-                formatted = Markup(f"{formatted} {tz_str}")
-            else:
-                tz_offset = date.strftime("%z")
-                if tz_offset:
-                    formatted = Markup(
-                        f"{formatted} UTC{tz_offset[0]}{tz_offset[1:3]}:{tz_offset[3:5]}"
-                    )
-
-        return formatted
+        return Markup(
+            f"{date.year}-{date.month:02d}-{date.day:02d} "
+            f"{_time_of(date)}{_timezone_of(date)}"
+        )
 
     def _is_external_link(self, href: str) -> bool:
         """Determine if a link is external.
@@ -161,33 +281,22 @@ class TemplateRenderer:
         Returns:
             True if the link is external, False otherwise
         """
-        # Skip empty hrefs
-        if not href:
-            return False
-
-        # Relative links (starting with /, #, or no scheme) are internal
-        if href.startswith("/") or href.startswith("#"):
-            return False
-
-        # Parse the URL
-        parsed = urlparse(href)
-
-        # If there's no scheme or netloc, it's a relative link (internal)
-        if not parsed.scheme and not parsed.netloc:
-            return False
-
-        # If we have a site domain, check if the link matches
-        if self.site_domain:
-            link_domain = parsed.netloc.lower()
-            # If domains match, it's internal
-            if (
-                link_domain == self.site_domain
-                or link_domain == f"www.{self.site_domain}"
-            ):
-                return False
-
-        # All other links with schemes are external
-        return True
+        return is_external_link(href, self._internal_domains)
+
+    def _get_template(self, name: str) -> Template:
+        """Get a template, loading it on first use.
+
+        Args:
+            name: The name of the template.
+
+        Returns:
+            The template.
+        """
+        try:
+            return self._templates[name]
+        except KeyError:
+            template = self._templates[name] = self.env.get_template(name)
+            return template
 
     def render_post(self, post: Post, **context: Any) -> str:
         """Render a single blog post.
@@ -199,7 +308,7 @@ class TemplateRenderer:
         Returns:
             Rendered HTML string
         """
-        template = self.env.get_template("post.html")
+        template = self._get_template("post.html")
         return template.render(
             post=post, extra_stylesheets=self.extra_stylesheets, **context
         )
@@ -214,7 +323,7 @@ class TemplateRenderer:
         Returns:
             Rendered HTML string
         """
-        template = self.env.get_template("page.html")
+        template = self._get_template("page.html")
         return template.render(
             page=page, extra_stylesheets=self.extra_stylesheets, **context
         )
@@ -237,7 +346,7 @@ class TemplateRenderer:
         Returns:
             Rendered HTML string
         """
-        template = self.env.get_template("index.html")
+        template = self._get_template("index.html")
         return template.render(
             posts=posts,
             page=page,
@@ -266,7 +375,7 @@ class TemplateRenderer:
         Returns:
             Rendered HTML string
         """
-        template = self.env.get_template("archive.html")
+        template = self._get_template("archive.html")
         return template.render(
             posts=posts,
             archive_title=archive_title,
@@ -296,7 +405,7 @@ class TemplateRenderer:
         Returns:
             Rendered HTML string
         """
-        template = self.env.get_template("tag.html")
+        template = self._get_template("tag.html")
         return template.render(
             tag=tag,
             posts=posts,
@@ -326,7 +435,7 @@ class TemplateRenderer:
         Returns:
             Rendered HTML string
         """
-        template = self.env.get_template("category.html")
+        template = self._get_template("category.html")
         return template.render(
             category=category,
             posts=posts,
@@ -350,7 +459,7 @@ class TemplateRenderer:
         Returns:
             Rendered HTML string
         """
-        template = self.env.get_template("tags.html")
+        template = self._get_template("tags.html")
         return template.render(
             tags=tags,
             extra_stylesheets=self.extra_stylesheets,
@@ -371,7 +480,7 @@ class TemplateRenderer:
         Returns:
             Rendered HTML string
         """
-        template = self.env.get_template("categories.html")
+        template = self._get_template("categories.html")
         return template.render(
             categories=categories,
             extra_stylesheets=self.extra_stylesheets,
@@ -387,7 +496,7 @@ class TemplateRenderer:
         Returns:
             Rendered HTML string.
         """
-        template = self.env.get_template("search.html")
+        template = self._get_template("search.html")
         return template.render(extra_stylesheets=self.extra_stylesheets, **context)
 
     def render_stats_page(self, **context: Any) -> str:
@@ -401,7 +510,7 @@ class TemplateRenderer:
         Returns:
             Rendered HTML string.
         """
-        template = self.env.get_template("stats.html")
+        template = self._get_template("stats.html")
         return template.render(extra_stylesheets=self.extra_stylesheets, **context)
 
     def render_calendar_page(self, **context: Any) -> str:
@@ -415,7 +524,7 @@ class TemplateRenderer:
         Returns:
             Rendered HTML string.
         """
-        template = self.env.get_template("calendar.html")
+        template = self._get_template("calendar.html")
         return template.render(extra_stylesheets=self.extra_stylesheets, **context)
 
     def render_graph_page(self, **context: Any) -> str:
@@ -430,7 +539,7 @@ class TemplateRenderer:
         Returns:
             Rendered HTML string.
         """
-        template = self.env.get_template("graph.html")
+        template = self._get_template("graph.html")
         return template.render(extra_stylesheets=self.extra_stylesheets, **context)
 
     def render_template(self, template_name: str, **context: Any) -> str:
@@ -443,5 +552,5 @@ class TemplateRenderer:
         Returns:
             Rendered HTML string
         """
-        template = self.env.get_template(template_name)
+        template = self._get_template(template_name)
         return template.render(extra_stylesheets=self.extra_stylesheets, **context)
@@ -1,7 +1,9 @@
 """XML sitemap generation for static sites."""
 
+import os
+from collections.abc import Iterable, Iterator
 from pathlib import Path
-from xml.etree.ElementTree import Element, SubElement, indent, tostring
+from xml.sax.saxutils import escape
 
 from blogmore.clean_url import make_url_clean
 from blogmore.parser import CUSTOM_404_HTML
@@ -26,6 +28,33 @@ def _build_excluded_paths(search_path: str) -> frozenset[str]:
     return frozenset({search_path.lstrip("/"), CUSTOM_404_HTML})
 
 
+def _html_files(output_dir: Path) -> Iterator[str]:
+    """Find every HTML file in the output directory.
+
+    The directory is walked with `os.scandir`, which gets the type of
+    each entry from the directory listing itself, rather than making a
+    `Path` for, and a `stat` of, every entry. Symlinked directories are
+    not followed, and the `.html` suffix is matched with the platform's
+    case sensitivity, as `Path.rglob` does.
+
+    Args:
+        output_dir: The output directory containing the generated site.
+
+    Yields:
+        The path of each HTML file, relative to the output directory and
+        using forward slashes.
+    """
+    pending = [(str(output_dir), "")]
+    while pending:
+        directory, prefix = pending.pop()
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    pending.append((entry.path, f"{prefix}{entry.name}/"))
+                elif os.path.normcase(entry.name).endswith(".html"):
+                    yield f"{prefix}{entry.name}"
+
+
 def collect_sitemap_urls(
     output_dir: Path,
     site_url: str,
@@ -75,13 +104,10 @@ def collect_sitemap_urls(
     excluded_paths = _build_excluded_paths(search_path) | extra_excluded_paths
 
     urls = []
-    for html_file in sorted(output_dir.rglob("*.html")):
-        relative_path = html_file.relative_to(output_dir)
-
+    for relative_str in _html_files(output_dir):
         # Exclude certain pages (e.g. the search page and 404 page).
         # Compare the full relative path so that pages in subdirectories
         # and pages with custom names are handled correctly.
-        relative_str = str(relative_path).replace("\\", "/")
         if relative_str in excluded_paths:
             continue
 
@@ -100,6 +126,25 @@ def collect_sitemap_urls(
     return sorted(urls)
 
 
+def _sitemap_xml_parts(urls: Iterable[str]) -> Iterator[str]:
+    """Generate the XML sitemap a piece at a time.
+
+    The sitemap is simple and flat enough that building it as strings is
+    much cheaper than building, indenting and serialising a tree.
+
+    Args:
+        urls: The absolute URL strings to include in the sitemap.
+
+    Yields:
+        The pieces of the sitemap, in order.
+    """
+    yield '<?xml version="1.0" encoding="UTF-8"?>\n'
+    yield f'<urlset xmlns="{SITEMAP_XMLNS}">\n'
+    for url in urls:
+        yield f"  <url>\n    <loc>{escape(url)}</loc>\n  </url>\n"
+    yield "</urlset>\n"
+
+
 def generate_sitemap_xml(urls: list[str]) -> str:
     """Generate XML sitemap content from a list of URLs.
 
@@ -113,17 +158,7 @@ def generate_sitemap_xml(urls: list[str]) -> str:
     Returns:
         Well-formed XML sitemap as a UTF-8 string.
     """
-    root = Element("urlset")
-    root.set("xmlns", SITEMAP_XMLNS)
-
-    for url in urls:
-        url_elem = SubElement(root, "url")
-        loc = SubElement(url_elem, "loc")
-        loc.text = url
-
-    indent(root, space="  ")
-    xml_str = tostring(root, encoding="unicode", xml_declaration=False)
-    return f'<?xml version="1.0" encoding="UTF-8"?>\n{xml_str}\n'
+    return "".join(_sitemap_xml_parts(urls))
 
 
 def write_sitemap(
@@ -169,6 +204,7 @@ def write_sitemap(
         extra_excluded_paths=extra_excluded_paths,
         extra_urls=extra_urls,
     )
-    xml_content = generate_sitemap_xml(urls)
-    sitemap_path = output_dir / SITEMAP_FILENAME
-    sitemap_path.write_text(xml_content, encoding="utf-8")
+    # Stream the sitemap straight into the file rather than building the
+    # whole document in memory first.
+    with (output_dir / SITEMAP_FILENAME).open("w", encoding="utf-8") as sitemap:
+        sitemap.writelines(_sitemap_xml_parts(urls))
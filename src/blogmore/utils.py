@@ -13,6 +13,17 @@ from pathlib import Path
 
 from blogmore.markdown.plain_text import html_to_plain_text
 
+_WORD_PATTERN = re.compile(r"\w+")
+"""Pattern that matches a single word when counting words."""
+
+_ROOT_RELATIVE_URL_PATTERN = re.compile(r'(src|href)=(["\'])(/[^"\']*)\2')
+"""Pattern that matches a `src` or `href` attribute with a root-relative URL."""
+
+_PICTURE_PATTERN = re.compile(
+    r"<picture\b[^>]*>.*?(<img\b[^>]*>).*?</picture>", re.DOTALL | re.IGNORECASE
+)
+"""Pattern that matches a `<picture>` element, capturing its nested `<img>` tag."""
+
 
 @contextmanager
 def timed_step(label: str) -> Generator[None, None, None]:
@@ -96,13 +107,9 @@ def count_words_from_html(html_content: str) -> int:
         10
     """
     return len(
-        [
-            word
-            for word in re.findall(
-                r"\w+", html_to_plain_text(html_content, exclude_code_blocks=True)
-            )
-            if word
-        ]
+        _WORD_PATTERN.findall(
+            html_to_plain_text(html_content, exclude_code_blocks=True)
+        )
     )
 
 
@@ -157,11 +164,7 @@ def make_urls_absolute(html_content: str, base_url: str) -> str:
         attr, quote, path = match.group(1), match.group(2), match.group(3)
         return f"{attr}={quote}{stripped}{path}{quote}"
 
-    return re.sub(
-        r'(src|href)=(["\'])(/[^"\']*)\2',
-        _replace,
-        html_content,
-    )
+    return _ROOT_RELATIVE_URL_PATTERN.sub(_replace, html_content)
 
 
 def normalize_site_url(site_url: str) -> str:
@@ -212,12 +215,7 @@ def simplify_html_for_feeds(html_content: str) -> str:
     # Replace <picture>...</picture> with just the nested <img> tag.
     # We look for <img ...> inside the picture tags and capture it.
     # The [^>]*? ensures we handle multi-line tags or attributes correctly.
-    return re.sub(
-        r"<picture\b[^>]*>.*?(<img\b[^>]*>).*?</picture>",
-        r"\1",
-        html_content,
-        flags=re.DOTALL | re.IGNORECASE,
-    )
+    return _PICTURE_PATTERN.sub(r"\1", html_content)
 
 
 ### utils.py ends here
@@ -26,31 +26,44 @@ def mock_user_cache_dir(tmp_path: Path) -> Iterator[Path]:
         yield test_cache
 
 
-@pytest.fixture
+@pytest.fixture(scope="session", autouse=True)
+def mock_template_cache_dir(tmp_path_factory: pytest.TempPathFactory) -> Iterator[Path]:
+    """Automatically mock the cache directory for compiled templates.
+
+    Jinja2 environments can be made by module-scoped fixtures before any
+    function-scoped mock is in place, so the directory they cache compiled
+    templates in is mocked for the whole session.
+    """
+    test_cache = tmp_path_factory.mktemp("blogmore_template_cache")
+    with patch("blogmore.renderer.get_user_cache_dir", return_value=test_cache):
+        yield test_cache
+
+
+@pytest.fixture(scope="session")
 def fixtures_dir() -> Path:
     """Return the path to the fixtures directory."""
     return Path(__file__).parent / "fixtures"
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def posts_dir(fixtures_dir: Path) -> Path:
     """Return the path to the posts fixtures directory."""
     return fixtures_dir / "posts"
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def pages_dir(fixtures_dir: Path) -> Path:
     """Return the path to the pages fixtures directory."""
     return fixtures_dir / "pages"
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def templates_dir(fixtures_dir: Path) -> Path:
     """Return the path to the templates fixtures directory."""
     return fixtures_dir / "templates"
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_post() -> Post:
     """Return a sample Post object for testing."""
     return Post(
@@ -66,7 +79,7 @@ def sample_post() -> Post:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_draft_post() -> Post:
     """Return a sample draft Post object for testing."""
     return Post(
@@ -82,7 +95,7 @@ def sample_draft_post() -> Post:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_post_without_date() -> Post:
     """Return a sample Post without a date for testing."""
     return Post(
@@ -98,7 +111,7 @@ def sample_post_without_date() -> Post:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_page() -> Page:
     """Return a sample Page object for testing."""
     return Page(
@@ -277,6 +277,30 @@ class TestSiteGenerator:
 
         assert generator.site_config.templates_dir == templates_dir
 
+    def test_generate_picks_up_custom_template_added_between_builds(
+        self, posts_dir: Path, temp_output_dir: Path, tmp_path: Path
+    ) -> None:
+        """Test that a custom template added after a build is used by the next."""
+        templates_dir = tmp_path / "templates"
+        templates_dir.mkdir()
+        generator = SiteGenerator(
+            site_config=SiteConfig(
+                content_dir=posts_dir,
+                templates_dir=templates_dir,
+                output_dir=temp_output_dir,
+            )
+        )
+        index_file = temp_output_dir / "index.html"
+
+        generator.generate()
+        assert "ADDED INDEX TEMPLATE" not in index_file.read_text()
+
+        (templates_dir / "index.html").write_text(
+            "<html><body>ADDED INDEX TEMPLATE</body></html>"
+        )
+        generator.generate()
+        assert "ADDED INDEX TEMPLATE" in index_file.read_text()
+
     def test_generate_basic(self, posts_dir: Path, temp_output_dir: Path) -> None:
         """Test basic site generation."""
         generator = SiteGenerator(
@@ -1,11 +1,15 @@
 """Unit tests for the parser module."""
 
+import dataclasses
 import datetime as dt
+import os
 import re
 from pathlib import Path
 
 import markdown
 import pytest
+import yaml
+from pytest_mock import MockerFixture
 
 from blogmore.markdown import create_custom_extensions
 from blogmore.markdown.first_paragraph import extract_first_paragraph_from_html
@@ -13,6 +17,7 @@ from blogmore.parser import (
     Page,
     Post,
     PostParser,
+    parse_date_string,
     remove_date_prefix,
     sanitize_for_url,
 )
@@ -38,6 +43,12 @@ def _extract_p(content: str) -> str:
     return extract_first_paragraph_from_html(md.convert(content))
 
 
+@pytest.fixture(scope="module")
+def parser() -> PostParser:
+    """Return a default parser shared by the tests in this module."""
+    return PostParser()
+
+
 class TestSanitizeForUrl:
     """Test the sanitize_for_url function."""
 
@@ -73,6 +84,13 @@ class TestSanitizeForUrl:
         """Test that leading and trailing dashes are removed."""
         assert sanitize_for_url("--hello-world--") == "hello-world"
 
+    def test_sanitize_repeated_value_is_cached(self) -> None:
+        """Test that sanitizing the same tag again reuses the first result."""
+        first = sanitize_for_url("Python Programming")
+        hits = sanitize_for_url.cache_info().hits
+        assert sanitize_for_url("Python Programming") is first
+        assert sanitize_for_url.cache_info().hits == hits + 1
+
 
 class TestRemoveDatePrefix:
     """Test the remove_date_prefix function."""
@@ -90,6 +108,33 @@ class TestRemoveDatePrefix:
         assert remove_date_prefix("2024-01-my-post") == "2024-01-my-post"
 
 
+class TestParseDateString:
+    """Test the parse_date_string function."""
+
+    def test_parse_iso_string(self) -> None:
+        """Test parsing an ISO 8601 string with a timezone offset."""
+        result = parse_date_string("2024-01-15T10:30:00+00:00")
+        assert result == dt.datetime(2024, 1, 15, 10, 30, tzinfo=dt.UTC)
+
+    def test_parse_space_separated_string_with_compact_offset(self) -> None:
+        """Test parsing a space-separated string with a `+0000` style offset."""
+        result = parse_date_string("2024-01-15 10:30:00 +0000")
+        assert result == dt.datetime(2024, 1, 15, 10, 30, tzinfo=dt.UTC)
+
+    def test_parse_date_only(self) -> None:
+        """Test parsing a date with no time component."""
+        assert parse_date_string("2024-01-15") == dt.datetime(2024, 1, 15)
+
+    def test_parse_non_iso_string(self) -> None:
+        """Test that strings that aren't ISO 8601 still parse via the fallbacks."""
+        assert parse_date_string("2024-1-5") == dt.datetime(2024, 1, 5)
+        assert parse_date_string("January 15, 2024") == dt.datetime(2024, 1, 15)
+
+    def test_parse_invalid_string(self) -> None:
+        """Test that an unparseable string gives None."""
+        assert parse_date_string("not a date") is None
+
+
 class TestExtractFirstParagraph:
     """Test the first paragraph extraction logic."""
 
@@ -313,6 +358,13 @@ class TestPost:
         )
         assert post.url == "/2024/01/15/my-post.html"
 
+    def test_post_url_path_set_after_url_used(self, sample_post: Post) -> None:
+        """Test that a URL path set by the generator wins over an earlier URL."""
+        post = dataclasses.replace(sample_post)
+        assert post.url == "/2024/01/15/test-post.html"
+        post.url_path = "/posts/test-post/"
+        assert post.url == "/posts/test-post/"
+
     def test_safe_category(self, sample_post: Post) -> None:
         """Test safe_category property."""
         assert sample_post.safe_category == "python"
@@ -620,9 +672,8 @@ class TestPage:
 class TestPostParser:
     """Test the PostParser class."""
 
-    def test_parse_file_simple_post(self, posts_dir: Path) -> None:
+    def test_parse_file_simple_post(self, parser: PostParser, posts_dir: Path) -> None:
         """Test parsing a simple post file."""
-        parser = PostParser()
         post = parser.parse_file(posts_dir / "2024-01-15-first-post.md")
 
         assert post.title == "My First Post"
@@ -634,25 +685,24 @@ class TestPostParser:
         assert "This is my first blog post!" in post.content
         assert "<p>This is my first blog post!</p>" in post.html_content
 
-    def test_parse_file_draft_post(self, posts_dir: Path) -> None:
+    def test_parse_file_draft_post(self, parser: PostParser, posts_dir: Path) -> None:
         """Test parsing a draft post."""
-        parser = PostParser()
         post = parser.parse_file(posts_dir / "2024-01-20-draft-post.md")
 
         assert post.title == "Draft Post"
         assert post.draft is True
 
-    def test_parse_file_no_date(self, posts_dir: Path) -> None:
+    def test_parse_file_no_date(self, parser: PostParser, posts_dir: Path) -> None:
         """Test parsing a post without a date."""
-        parser = PostParser()
         post = parser.parse_file(posts_dir / "2024-02-01-no-date-post.md")
 
         assert post.title == "Post Without Date"
         assert post.date is None
 
-    def test_parse_file_complex_markdown(self, posts_dir: Path) -> None:
+    def test_parse_file_complex_markdown(
+        self, parser: PostParser, posts_dir: Path
+    ) -> None:
         """Test parsing a post with complex Markdown features."""
-        parser = PostParser()
         post = parser.parse_file(posts_dir / "2024-01-10-complex-post.md")
 
         assert post.title == "Complex Post with Many Features"
@@ -663,32 +713,51 @@ class TestPostParser:
         # Check that footnotes are rendered
         assert "footnote" in post.html_content.lower()
 
-    def test_parse_file_not_found(self) -> None:
+    def test_parse_file_not_found(self, parser: PostParser) -> None:
         """Test parsing a non-existent file raises FileNotFoundError."""
-        parser = PostParser()
         with pytest.raises(FileNotFoundError):
             parser.parse_file(Path("nonexistent.md"))
 
-    def test_parse_file_missing_title(self, tmp_path: Path) -> None:
+    def test_parse_file_missing_title(self, parser: PostParser, tmp_path: Path) -> None:
         """Test that parsing a file without title raises ValueError."""
-        parser = PostParser()
         post_file = tmp_path / "no-title.md"
         post_file.write_text("---\ndate: 2024-01-01\n---\nContent")
 
         with pytest.raises(ValueError, match="missing required 'title'"):
             parser.parse_file(post_file)
 
-    def test_parse_file_malformed_yaml(self, tmp_path: Path) -> None:
+    def test_parse_file_malformed_yaml(
+        self, parser: PostParser, tmp_path: Path
+    ) -> None:
         """Test that malformed YAML raises ValueError with helpful message."""
-        parser = PostParser()
         post_file = tmp_path / "bad-yaml.md"
         post_file.write_text("---\ntitle: My post: the sequel\n---\nContent")
 
         with pytest.raises(ValueError, match="YAML syntax error"):
             parser.parse_file(post_file)
 
+    @pytest.mark.skipif(not yaml.__with_libyaml__, reason="libyaml not available")
+    def test_parse_file_uses_libyaml_loader(
+        self, parser: PostParser, tmp_path: Path, mocker: MockerFixture
+    ) -> None:
+        """Test that post front-matter is parsed with the libyaml-backed loader.
+
+        Front-matter is parsed for every post and page on every build, so the
+        C loader should be used whenever PyYAML was built against libyaml.
+        """
+        post_file = tmp_path / "post.md"
+        post_file.write_text("---\ntitle: Fast Post\ndate: 2024-01-01\n---\nContent")
+        load = mocker.spy(yaml, "load")
+
+        post = parser.parse_file(post_file)
+
+        assert post.title == "Fast Post"
+        assert [call.kwargs.get("Loader") for call in load.call_args_list] == [
+            yaml.CSafeLoader
+        ]
+
     def test_parse_file_non_string_title_raises_helpful_error(
-        self, tmp_path: Path
+        self, parser: PostParser, tmp_path: Path
     ) -> None:
         """Test that a non-string title raises a helpful error citing the file.
 
@@ -697,16 +766,16 @@ class TestPostParser:
         which is wrong.  Instead the parser should raise a clear error
         telling the user which file is affected and how to fix it.
         """
-        parser = PostParser()
         post_file = tmp_path / "plus-one-title.md"
         post_file.write_text("---\ntitle: +1\ndate: 2024-01-01\n---\nContent")
 
         with pytest.raises(ValueError, match="'title' in frontmatter must be a string"):
             parser.parse_file(post_file)
 
-    def test_parse_file_non_string_title_error_cites_file(self, tmp_path: Path) -> None:
+    def test_parse_file_non_string_title_error_cites_file(
+        self, parser: PostParser, tmp_path: Path
+    ) -> None:
         """Test that the non-string title error message includes the filename."""
-        parser = PostParser()
         post_file = tmp_path / "bad-title.md"
         post_file.write_text("---\ntitle: +1\ndate: 2024-01-01\n---\nContent")
 
@@ -717,7 +786,9 @@ class TestPostParser:
         assert str(post_file) in error_message
         assert "Fix" in error_message
 
-    def test_parse_file_numeric_tags_coerced_to_str(self, tmp_path: Path) -> None:
+    def test_parse_file_numeric_tags_coerced_to_str(
+        self, parser: PostParser, tmp_path: Path
+    ) -> None:
         """Test that numeric tags (e.g. a year like 2024) are coerced to str.
 
         YAML parses bare numbers as int, so `tags: [2024, python]` yields
@@ -725,7 +796,6 @@ class TestPostParser:
         feed generators (feedgen) don't raise
         "Argument must be bytes or unicode, got 'int'".
         """
-        parser = PostParser()
         post_file = tmp_path / "numeric-tags.md"
         post_file.write_text(
             "---\n"
@@ -742,14 +812,15 @@ class TestPostParser:
         assert all(isinstance(tag, str) for tag in post.tags)
         assert post.tags == ["2024", "python"]
 
-    def test_parse_file_numeric_category_coerced_to_str(self, tmp_path: Path) -> None:
+    def test_parse_file_numeric_category_coerced_to_str(
+        self, parser: PostParser, tmp_path: Path
+    ) -> None:
         """Test that a numeric category value is coerced to str.
 
         YAML parses `category: 2024` as int.  The parser must convert it to
         str so that feed generators don't raise
         "Argument must be bytes or unicode, got 'int'".
         """
-        parser = PostParser()
         post_file = tmp_path / "numeric-category.md"
         post_file.write_text(
             "---\n"
@@ -766,7 +837,7 @@ class TestPostParser:
         assert post.category == "2024"
 
     def test_parse_file_bare_scalar_tag_raises_helpful_error(
-        self, tmp_path: Path
+        self, parser: PostParser, tmp_path: Path
     ) -> None:
         """Test that a bare scalar tags value raises a helpful error.
 
@@ -775,7 +846,6 @@ class TestPostParser:
         cryptic.  The parser should detect this case and raise a clear
         ``ValueError`` that names the file and explains the fix.
         """
-        parser = PostParser()
         post_file = tmp_path / "bare-scalar-tags.md"
         post_file.write_text(
             "---\n"
@@ -791,9 +861,10 @@ class TestPostParser:
         ):
             parser.parse_file(post_file)
 
-    def test_parse_file_bare_scalar_tag_error_cites_file(self, tmp_path: Path) -> None:
+    def test_parse_file_bare_scalar_tag_error_cites_file(
+        self, parser: PostParser, tmp_path: Path
+    ) -> None:
         """Test that the bare-scalar tags error message includes the filename."""
-        parser = PostParser()
         post_file = tmp_path / "bare-scalar-tags-2.md"
         post_file.write_text(
             "---\n"
@@ -811,14 +882,15 @@ class TestPostParser:
         assert str(post_file) in error_message
         assert "Fix" in error_message
 
-    def test_parse_file_bare_tags_entry_yields_no_tags(self, tmp_path: Path) -> None:
+    def test_parse_file_bare_tags_entry_yields_no_tags(
+        self, parser: PostParser, tmp_path: Path
+    ) -> None:
         """Test that a bare ``tags:`` frontmatter entry produces an empty tag list.
 
         A bare ``tags:`` with no associated value is parsed by YAML as ``None``.
         The parser should treat this silently as no tags rather than raising an
         error and skipping the post.
         """
-        parser = PostParser()
         post_file = tmp_path / "bare-tags.md"
         post_file.write_text(
             "---\ntitle: Post With Bare Tags\ndate: 2024-01-01\ntags:\n---\nContent"
@@ -828,9 +900,8 @@ class TestPostParser:
 
         assert post.tags == []
 
-    def test_parse_directory(self, posts_dir: Path) -> None:
+    def test_parse_directory(self, parser: PostParser, posts_dir: Path) -> None:
         """Test parsing a directory of posts."""
-        parser = PostParser()
         posts = parser.parse_directory(posts_dir, include_drafts=False)
 
         # Should have 7 posts (excluding draft), including nested subdirectory post
@@ -845,33 +916,33 @@ class TestPostParser:
         # Post without date should be last
         assert posts[6].title == "Post Without Date"
 
-    def test_parse_directory_include_drafts(self, posts_dir: Path) -> None:
+    def test_parse_directory_include_drafts(
+        self, parser: PostParser, posts_dir: Path
+    ) -> None:
         """Test parsing directory including drafts."""
-        parser = PostParser()
         posts = parser.parse_directory(posts_dir, include_drafts=True)
 
         # Should have 8 posts (including draft and nested subdirectory post)
         assert len(posts) == 8
 
     def test_parse_directory_finds_posts_in_subdirectories(
-        self, posts_dir: Path
+        self, parser: PostParser, posts_dir: Path
     ) -> None:
         """Test that posts in subdirectories are discovered recursively."""
-        parser = PostParser()
         posts = parser.parse_directory(posts_dir, include_drafts=False)
 
         titles = [post.title for post in posts]
         assert "Nested Post" in titles
 
-    def test_parse_directory_not_found(self) -> None:
+    def test_parse_directory_not_found(self, parser: PostParser) -> None:
         """Test parsing non-existent directory raises FileNotFoundError."""
-        parser = PostParser()
         with pytest.raises(FileNotFoundError):
             parser.parse_directory(Path("nonexistent"))
 
-    def test_parse_directory_excludes_subdirectory(self, tmp_path: Path) -> None:
+    def test_parse_directory_excludes_subdirectory(
+        self, parser: PostParser, tmp_path: Path
+    ) -> None:
         """Test that files in excluded subdirectories are not returned."""
-        parser = PostParser()
 
         # Create a post in the root content directory
         post_file = tmp_path / "my-post.md"
@@ -894,24 +965,84 @@ class TestPostParser:
         assert len(posts_with_exclusion) == 1
         assert posts_with_exclusion[0].title == "Regular Post"
 
-    def test_parse_page(self, pages_dir: Path) -> None:
+    def test_parse_directory_prunes_excluded_subtree(
+        self, parser: PostParser, tmp_path: Path, mocker: MockerFixture
+    ) -> None:
+        """Test that nothing below an excluded directory is scanned."""
+        (tmp_path / "my-post.md").write_text(
+            "---\ntitle: Regular Post\ndate: 2024-01-01\n---\nContent"
+        )
+        nested = tmp_path / "pages" / "nested"
+        nested.mkdir(parents=True)
+        (nested / "deep.md").write_text(
+            "---\ntitle: Deep Page\ndate: 2024-01-02\n---\nContent"
+        )
+        scandir = mocker.spy(os, "scandir")
+
+        posts = parser.parse_directory(tmp_path, exclude_dirs=[tmp_path / "pages"])
+
+        assert [post.title for post in posts] == ["Regular Post"]
+        scanned = [Path(call.args[0]) for call in scandir.call_args_list]
+        assert tmp_path in scanned
+        assert not any(path.is_relative_to(tmp_path / "pages") for path in scanned)
+
+    def test_parse_directory_excludes_symlinked_file_into_excluded_dir(
+        self, parser: PostParser, tmp_path: Path
+    ) -> None:
+        """Test that a symlinked post pointing into an excluded directory is skipped."""
+        pages_subdir = tmp_path / "pages"
+        pages_subdir.mkdir()
+        (pages_subdir / "about.md").write_text(
+            "---\ntitle: About Page\ndate: 2024-01-02\n---\nPage content"
+        )
+        (tmp_path / "about-link.md").symlink_to(pages_subdir / "about.md")
+
+        posts = parser.parse_directory(tmp_path, exclude_dirs=[pages_subdir])
+
+        assert posts == []
+
+    def test_parse_directory_excluded_root_returns_nothing(
+        self, parser: PostParser, tmp_path: Path, mocker: MockerFixture
+    ) -> None:
+        """Test that no posts are found when the directory itself is excluded."""
+        (tmp_path / "my-post.md").write_text(
+            "---\ntitle: Regular Post\ndate: 2024-01-01\n---\nContent"
+        )
+        scandir = mocker.spy(os, "scandir")
+
+        assert parser.parse_directory(tmp_path, exclude_dirs=[tmp_path]) == []
+        scandir.assert_not_called()
+
+    def test_parse_directory_matches_suffix_with_platform_case(
+        self, parser: PostParser, tmp_path: Path, mocker: MockerFixture
+    ) -> None:
+        """Test that the suffix is matched case-insensitively where paths are."""
+        (tmp_path / "POST.MD").write_text(
+            "---\ntitle: Shouting Post\ndate: 2024-01-01\n---\nContent"
+        )
+        assert parser.parse_directory(tmp_path) == []
+
+        # Simulate a case-insensitive platform, such as Windows.
+        mocker.patch("blogmore.parser.os.path.normcase", str.lower)
+        posts = parser.parse_directory(tmp_path)
+
+        assert [post.title for post in posts] == ["Shouting Post"]
+
+    def test_parse_page(self, parser: PostParser, pages_dir: Path) -> None:
         """Test parsing a static page."""
-        parser = PostParser()
         page = parser.parse_page(pages_dir / "about.md")
 
         assert page.title == "About Me"
         assert "This is a static page" in page.content
         assert "<p>This is a static page" in page.html_content
 
-    def test_parse_page_not_found(self) -> None:
+    def test_parse_page_not_found(self, parser: PostParser) -> None:
         """Test parsing non-existent page raises FileNotFoundError."""
-        parser = PostParser()
         with pytest.raises(FileNotFoundError):
             parser.parse_page(Path("nonexistent.md"))
 
-    def test_parse_page_missing_title(self, tmp_path: Path) -> None:
+    def test_parse_page_missing_title(self, parser: PostParser, tmp_path: Path) -> None:
         """Test that parsing page without title raises ValueError."""
-        parser = PostParser()
         page_file = tmp_path / "no-title.md"
         page_file.write_text("---\n---\nContent")
 
@@ -919,7 +1050,7 @@ class TestPostParser:
             parser.parse_page(page_file)
 
     def test_parse_page_non_string_title_raises_helpful_error(
-        self, tmp_path: Path
+        self, parser: PostParser, tmp_path: Path
     ) -> None:
         """Test that a non-string page title raises a helpful error.
 
@@ -927,16 +1058,14 @@ class TestPostParser:
         would produce ``"1"`` which is wrong.  The parser should raise a
         clear error naming the file and suggesting a fix.
         """
-        parser = PostParser()
         page_file = tmp_path / "bad-title-page.md"
         page_file.write_text("---\ntitle: +1\n---\nContent")
 
         with pytest.raises(ValueError, match="'title' in frontmatter must be a string"):
             parser.parse_page(page_file)
 
-    def test_parse_pages_directory(self, pages_dir: Path) -> None:
+    def test_parse_pages_directory(self, parser: PostParser, pages_dir: Path) -> None:
         """Test parsing a directory of pages."""
-        parser = PostParser()
         pages = parser.parse_pages_directory(pages_dir)
 
         assert len(pages) == 2
@@ -944,42 +1073,38 @@ class TestPostParser:
         assert pages[0].title == "About Me"
         assert pages[1].title == "SEO Test Page"
 
-    def test_parse_pages_directory_not_found(self) -> None:
+    def test_parse_pages_directory_not_found(self, parser: PostParser) -> None:
         """Test parsing non-existent pages directory returns empty list."""
-        parser = PostParser()
         pages = parser.parse_pages_directory(Path("nonexistent"))
         assert pages == []
 
-    def test_parse_pages_directory_excludes_404(self, pages_dir: Path) -> None:
+    def test_parse_pages_directory_excludes_404(
+        self, parser: PostParser, pages_dir: Path
+    ) -> None:
         """Test that 404.md is excluded from parse_pages_directory results."""
-        parser = PostParser()
         pages = parser.parse_pages_directory(pages_dir)
         slugs = [page.slug for page in pages]
         assert "404" not in slugs
 
-    def test_parse_404_page(self, pages_dir: Path) -> None:
+    def test_parse_404_page(self, parser: PostParser, pages_dir: Path) -> None:
         """Test parsing the custom 404 page."""
-        parser = PostParser()
         page = parser.parse_404_page(pages_dir)
         assert page is not None
         assert page.slug == "404"
         assert page.title == "Page Not Found"
 
-    def test_parse_404_page_missing(self, tmp_path: Path) -> None:
+    def test_parse_404_page_missing(self, parser: PostParser, tmp_path: Path) -> None:
         """Test that parse_404_page returns None when 404.md does not exist."""
-        parser = PostParser()
         page = parser.parse_404_page(tmp_path)
         assert page is None
 
-    def test_parse_404_page_directory_not_found(self) -> None:
+    def test_parse_404_page_directory_not_found(self, parser: PostParser) -> None:
         """Test that parse_404_page returns None when directory does not exist."""
-        parser = PostParser()
         page = parser.parse_404_page(Path("nonexistent"))
         assert page is None
 
-    def test_parse_date_formats(self, tmp_path: Path) -> None:
+    def test_parse_date_formats(self, parser: PostParser, tmp_path: Path) -> None:
         """Test parsing various date formats."""
-        parser = PostParser()
 
         # Test ISO format with time
         post_file = tmp_path / "date-test.md"
@@ -992,9 +1117,8 @@ class TestPostParser:
         assert post.date.month == 1
         assert post.date.day == 15
 
-    def test_parse_tags_string(self, tmp_path: Path) -> None:
+    def test_parse_tags_string(self, parser: PostParser, tmp_path: Path) -> None:
         """Test parsing tags as comma-separated string."""
-        parser = PostParser()
         post_file = tmp_path / "tags-test.md"
         post_file.write_text(
             '---\ntitle: Test\ntags: "python, webdev, testing"\n---\nContent'
@@ -1002,9 +1126,8 @@ class TestPostParser:
         post = parser.parse_file(post_file)
         assert post.tags == ["python", "webdev", "testing"]
 
-    def test_parse_tags_list(self, tmp_path: Path) -> None:
+    def test_parse_tags_list(self, parser: PostParser, tmp_path: Path) -> None:
         """Test parsing tags as YAML list."""
-        parser = PostParser()
         post_file = tmp_path / "tags-test.md"
         post_file.write_text(
             "---\ntitle: Test\ntags: [python, webdev, testing]\n---\nContent"
@@ -1012,9 +1135,10 @@ class TestPostParser:
         post = parser.parse_file(post_file)
         assert post.tags == ["python", "webdev", "testing"]
 
-    def test_markdown_reset_between_parses(self, posts_dir: Path) -> None:
+    def test_markdown_reset_between_parses(
+        self, parser: PostParser, posts_dir: Path
+    ) -> None:
         """Test that markdown parser is reset between parses."""
-        parser = PostParser()
         post1 = parser.parse_file(posts_dir / "2024-01-15-first-post.md")
         post2 = parser.parse_file(posts_dir / "2024-01-10-complex-post.md")
 
@@ -1047,13 +1171,14 @@ This post has [an external link](https://external.com) and
         assert 'href="/posts/my-post"' in post.html_content
         assert post.html_content.count('target="_blank"') == 1  # Only external link
 
-    def test_footnote_ids_unique_across_multiple_posts(self, tmp_path: Path) -> None:
+    def test_footnote_ids_unique_across_multiple_posts(
+        self, parser: PostParser, tmp_path: Path
+    ) -> None:
         """Test that footnote IDs are unique when multiple posts are parsed.
 
         When multiple posts with footnotes appear on the same index page,
         footnote IDs must not clash to avoid duplicate IDs in the DOM.
         """
-        parser = PostParser()
 
         post_file_1 = tmp_path / "post-one.md"
         post_file_1.write_text(
@@ -1103,7 +1228,7 @@ This post has [an external link](https://external.com) and
         assert post.html_content.count('target="_blank"') == 1
 
     def test_post_content_starting_with_numeric_is_fully_rendered(
-        self, tmp_path: Path
+        self, parser: PostParser, tmp_path: Path
     ) -> None:
         """Test that post content starting with a numeric character is rendered correctly.
 
@@ -1111,7 +1236,6 @@ This post has [an external link](https://external.com) and
         such as "7:54am ..." as metadata (key "7", value "54am ..."), causing the
         first line to be silently dropped from the HTML output.
         """
-        parser = PostParser()
         post_file = tmp_path / "numeric-start.md"
         post_file.write_text(
             "---\ntitle: Starts With Numeric\n---\n\n"
@@ -1126,10 +1250,9 @@ This post has [an external link](https://external.com) and
         assert "This is paragraph two." in post.html_content
 
     def test_page_content_starting_with_numeric_is_fully_rendered(
-        self, tmp_path: Path
+        self, parser: PostParser, tmp_path: Path
     ) -> None:
         """Test that page content starting with a numeric character is rendered correctly."""
-        parser = PostParser()
         page_file = tmp_path / "numeric-start.md"
         page_file.write_text(
             "---\ntitle: Starts With Numeric\n---\n\n"
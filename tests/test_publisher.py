@@ -1,11 +1,17 @@
 """Tests for the publisher module."""
 
+import shutil
 import subprocess
+import tempfile
+from collections.abc import Callable
 from pathlib import Path
+from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 
 import pytest
+from pytest_mock import MockerFixture
 
+from blogmore import publisher
 from blogmore.publisher import (
     PublishError,
     check_git_available,
@@ -14,61 +20,241 @@ from blogmore.publisher import (
     publish_site,
 )
 
+_SOME_PATH = Path("/some/path")
+"""A directory to run the git checks against."""
+
+_CURRENT_DIR = Path("/current/dir")
+"""The directory `Path.cwd` is patched to return."""
+
+_REPO_ROOT = Path("/path/to/repo")
+"""The repository root reported by the mocked git."""
+
+
+def _completed_process(returncode: int = 0, stdout: str = "") -> MagicMock:
+    """Make a mock of a completed `subprocess.run` call.
+
+    Args:
+        returncode: The return code of the process.
+        stdout: The output of the process.
+
+    Returns:
+        A mock specced to `subprocess.CompletedProcess`.
+    """
+    return MagicMock(
+        spec=subprocess.CompletedProcess, returncode=returncode, stdout=stdout
+    )
+
+
+_MOCK_SUCCESS = _completed_process()
+"""A successful git command with no output."""
+
+_MOCK_FAILURE = _completed_process(1)
+"""A failed git command with no output."""
+
+_MOCK_SUCCESS_REPOSITORY_ROOT = _completed_process(stdout="/path/to/repo\n")
+"""A successful `git rev-parse --show-toplevel`."""
+
+
+def _refuse_popen(*args: object, **kwargs: object) -> None:
+    """Stand in for `subprocess.Popen`, refusing to start a process.
+
+    Raises:
+        RuntimeError: Always; no test should run a real command.
+    """
+    raise RuntimeError("Attempt to run a real subprocess in a publisher test")
+
+
+@pytest.fixture(autouse=True)
+def no_real_subprocess(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Make sure a test that misses a patch can't run the real `git`."""
+    monkeypatch.setattr(subprocess, "Popen", _refuse_popen)
+
+
+@pytest.fixture(autouse=True)
+def reset_process_mocks() -> None:
+    """Clear any calls recorded against the shared completed-process mocks."""
+    for mock in (_MOCK_SUCCESS, _MOCK_FAILURE, _MOCK_SUCCESS_REPOSITORY_ROOT):
+        mock.reset_mock()
+
+
+def _fake_git(
+    *,
+    branch_exists: bool,
+    has_changes: bool,
+    history: list[list[str]] | None = None,
+) -> Callable[..., MagicMock]:
+    """Make a stand in for `subprocess.run` while publishing.
+
+    Args:
+        branch_exists: Whether the publishing branch exists locally.
+        has_changes: Whether there are changes to commit.
+        history: Optional list to record every git command in.
+
+    Returns:
+        A function to use as the side effect of the mocked `subprocess.run`.
+    """
+
+    def run(*args: object, **kwargs: object) -> MagicMock:
+        """Give the completed process for a git command.
+
+        Args:
+            *args: The positional arguments given to `subprocess.run`.
+            **kwargs: The keyword arguments given to `subprocess.run`.
+
+        Returns:
+            A mock of the completed process.
+        """
+        command = args[0] if args else []
+        if not isinstance(command, list):
+            return _MOCK_SUCCESS
+        if history is not None and command[0] == "git":
+            history.append(command)
+        match command:
+            case ["git", "rev-parse", "--verify", *_]:
+                return _MOCK_SUCCESS if branch_exists else _MOCK_FAILURE
+            case ["git", "diff", *_]:
+                return _MOCK_FAILURE if has_changes else _MOCK_SUCCESS
+            case _:
+                # Everything else succeeds, including `git ls-remote`, as
+                # the branch never exists remotely.
+                return _MOCK_SUCCESS
+
+    return run
+
+
+def _command_prefixes(mock_run: MagicMock) -> set[tuple[str, ...]]:
+    """Collect the leading words of every command given to a mocked `subprocess.run`.
+
+    The calls are scanned once, recording both the two- and three-word
+    prefix of each command, so tests can check for a command with a simple
+    membership test.
+
+    Args:
+        mock_run: The mocked `subprocess.run`.
+
+    Returns:
+        The set of two- and three-word command prefixes.
+    """
+    prefixes: set[tuple[str, ...]] = set()
+    for call in mock_run.call_args_list:
+        if call.args and isinstance(command := call.args[0], list):
+            prefixes.add(tuple(command[:2]))
+            prefixes.add(tuple(command[:3]))
+    return prefixes
+
+
+@pytest.fixture
+def publish_mocks(mocker: MockerFixture, tmp_path: Path) -> SimpleNamespace:
+    """Patch everything `publish_site` uses to talk to git and the filesystem.
+
+    The git checks all pass, the git root and the worktree are real (empty)
+    directories below `tmp_path`, and `subprocess.run` is left for each test
+    to give a side effect.
+
+    Returns:
+        A namespace holding each mock, plus the `worktree_path`.
+    """
+    git_root = tmp_path / "repo"
+    git_root.mkdir()
+    worktree_path = tmp_path / "worktree"
+    worktree_path.mkdir()
+    return SimpleNamespace(
+        run=mocker.patch.object(subprocess, "run"),
+        rmtree=mocker.patch.object(shutil, "rmtree"),
+        copy2=mocker.patch.object(shutil, "copy2"),
+        copytree=mocker.patch.object(shutil, "copytree"),
+        mkdtemp=mocker.patch.object(
+            tempfile, "mkdtemp", return_value=str(worktree_path)
+        ),
+        check_git_available=mocker.patch.object(
+            publisher, "check_git_available", return_value=True
+        ),
+        check_is_git_repository=mocker.patch.object(
+            publisher, "check_is_git_repository", return_value=True
+        ),
+        get_git_root=mocker.patch.object(
+            publisher, "get_git_root", return_value=git_root
+        ),
+        worktree_path=worktree_path,
+    )
+
+
+@pytest.fixture(scope="module")
+def output_dir(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """A generated site for `publish_site` to publish.
+
+    `publish_site` only reads from the output directory, so one directory is
+    built per module and shared by every test that doesn't need to change it.
+
+    Returns:
+        The path to the output directory.
+    """
+    output = tmp_path_factory.mktemp("output")
+    (output / "index.html").write_text("<html></html>")
+    return output
+
 
 class TestCheckGitAvailable:
     """Tests for check_git_available function."""
 
-    def test_git_available(self) -> None:
+    @pytest.fixture(autouse=True)
+    def mock_which(self, mocker: MockerFixture) -> MagicMock:
+        """Patch `shutil.which` for every test in the class."""
+        return mocker.patch.object(shutil, "which")
+
+    def test_git_available(self, mock_which: MagicMock) -> None:
         """Test when git is available in PATH."""
-        with patch("shutil.which", return_value="/usr/bin/git"):
-            assert check_git_available() is True
+        mock_which.return_value = "/usr/bin/git"
+        assert check_git_available() is True
 
-    def test_git_not_available(self) -> None:
+    def test_git_not_available(self, mock_which: MagicMock) -> None:
         """Test when git is not available in PATH."""
-        with patch("shutil.which", return_value=None):
-            assert check_git_available() is False
+        mock_which.return_value = None
+        assert check_git_available() is False
 
 
 class TestCheckIsGitRepository:
     """Tests for check_is_git_repository function."""
 
-    def test_is_git_repository(self) -> None:
+    @pytest.fixture(autouse=True)
+    def mock_run(self, mocker: MockerFixture) -> MagicMock:
+        """Patch `subprocess.run` for every test in the class."""
+        return mocker.patch.object(subprocess, "run")
+
+    def test_is_git_repository(self, mock_run: MagicMock) -> None:
         """Test when path is in a git repository."""
-        with patch("subprocess.run") as mock_run:
-            mock_run.return_value = MagicMock(returncode=0)
-            assert check_is_git_repository(Path("/some/path")) is True
-            mock_run.assert_called_once_with(
-                ["git", "rev-parse", "--git-dir"],
-                cwd=Path("/some/path"),
-                capture_output=True,
-                check=False,
-            )
+        mock_run.return_value = _MOCK_SUCCESS
+        assert check_is_git_repository(_SOME_PATH) is True
+        mock_run.assert_called_once_with(
+            ["git", "rev-parse", "--git-dir"],
+            cwd=_SOME_PATH,
+            capture_output=True,
+            check=False,
+        )
 
-    def test_not_git_repository(self) -> None:
+    def test_not_git_repository(self, mock_run: MagicMock) -> None:
         """Test when path is not in a git repository."""
-        with patch("subprocess.run") as mock_run:
-            mock_run.return_value = MagicMock(returncode=1)
-            assert check_is_git_repository(Path("/some/path")) is False
+        mock_run.return_value = _MOCK_FAILURE
+        assert check_is_git_repository(_SOME_PATH) is False
 
-    def test_subprocess_exception(self) -> None:
+    def test_subprocess_exception(self, mock_run: MagicMock) -> None:
         """Test when subprocess raises an exception."""
-        with patch("subprocess.run", side_effect=Exception("Test error")):
-            assert check_is_git_repository(Path("/some/path")) is False
+        mock_run.side_effect = Exception("Test error")
+        assert check_is_git_repository(_SOME_PATH) is False
 
-    def test_default_path_uses_cwd(self) -> None:
+    def test_default_path_uses_cwd(
+        self, mock_run: MagicMock, mocker: MockerFixture
+    ) -> None:
         """Test that default path is current working directory."""
-        with (
-            patch("subprocess.run") as mock_run,
-            patch("pathlib.Path.cwd", return_value=Path("/current/dir")),
-        ):
-            mock_run.return_value = MagicMock(returncode=0)
-            check_is_git_repository()
-            mock_run.assert_called_once_with(
-                ["git", "rev-parse", "--git-dir"],
-                cwd=Path("/current/dir"),
-                capture_output=True,
-                check=False,
-            )
+        mocker.patch("pathlib.Path.cwd", return_value=_CURRENT_DIR)
+        mock_run.return_value = _MOCK_SUCCESS
+        check_is_git_repository()
+        mock_run.assert_called_once_with(
+            ["git", "rev-parse", "--git-dir"],
+            cwd=_CURRENT_DIR,
+            capture_output=True,
+            check=False,
+        )
 
 
 class TestGetGitRoot:
@@ -76,13 +262,13 @@ class TestGetGitRoot:
 
     def test_get_git_root_success(self) -> None:
         """Test successfully getting git root."""
-        with patch("subprocess.run") as mock_run:
-            mock_run.return_value = MagicMock(returncode=0, stdout="/path/to/repo\n")
-            result = get_git_root(Path("/some/path"))
-            assert result == Path("/path/to/repo")
+        with patch.object(subprocess, "run") as mock_run:
+            mock_run.return_value = _MOCK_SUCCESS_REPOSITORY_ROOT
+            result = get_git_root(_SOME_PATH)
+            assert result == _REPO_ROOT
             mock_run.assert_called_once_with(
                 ["git", "rev-parse", "--show-toplevel"],
-                cwd=Path("/some/path"),
+                cwd=_SOME_PATH,
                 capture_output=True,
                 check=True,
                 text=True,
@@ -90,22 +276,22 @@ class TestGetGitRoot:
 
     def test_get_git_root_not_in_repo(self) -> None:
         """Test error when not in a git repository."""
-        with patch("subprocess.run") as mock_run:
+        with patch.object(subprocess, "run") as mock_run:
             mock_run.side_effect = subprocess.CalledProcessError(1, "git")
             with pytest.raises(PublishError, match="Not in a git repository"):
-                get_git_root(Path("/some/path"))
+                get_git_root(_SOME_PATH)
 
     def test_default_path_uses_cwd(self) -> None:
         """Test that default path is current working directory."""
         with (
-            patch("subprocess.run") as mock_run,
-            patch("pathlib.Path.cwd", return_value=Path("/current/dir")),
+            patch.object(subprocess, "run") as mock_run,
+            patch("pathlib.Path.cwd", return_value=_CURRENT_DIR),
         ):
-            mock_run.return_value = MagicMock(returncode=0, stdout="/path/to/repo\n")
+            mock_run.return_value = _MOCK_SUCCESS_REPOSITORY_ROOT
             get_git_root()
             mock_run.assert_called_once_with(
                 ["git", "rev-parse", "--show-toplevel"],
-                cwd=Path("/current/dir"),
+                cwd=_CURRENT_DIR,
                 capture_output=True,
                 check=True,
                 text=True,
@@ -115,27 +301,19 @@ class TestGetGitRoot:
 class TestPublishSite:
     """Tests for publish_site function."""
 
-    def test_publish_site_git_not_available(self, tmp_path: Path) -> None:
+    def test_publish_site_git_not_available(self, output_dir: Path) -> None:
         """Test error when git is not available."""
-        output_dir = tmp_path / "output"
-        output_dir.mkdir()
-        (output_dir / "index.html").write_text("<html></html>")
-
         with (
-            patch("blogmore.publisher.check_git_available", return_value=False),
+            patch.object(publisher, "check_git_available", return_value=False),
             pytest.raises(PublishError, match="Git command not found"),
         ):
             publish_site(output_dir)
 
-    def test_publish_site_not_in_git_repo(self, tmp_path: Path) -> None:
+    def test_publish_site_not_in_git_repo(self, output_dir: Path) -> None:
         """Test error when not in a git repository."""
-        output_dir = tmp_path / "output"
-        output_dir.mkdir()
-        (output_dir / "index.html").write_text("<html></html>")
-
         with (
-            patch("blogmore.publisher.check_git_available", return_value=True),
-            patch("blogmore.publisher.check_is_git_repository", return_value=False),
+            patch.object(publisher, "check_git_available", return_value=True),
+            patch.object(publisher, "check_is_git_repository", return_value=False),
             pytest.raises(PublishError, match="Not in a git repository"),
         ):
             publish_site(output_dir)
@@ -145,9 +323,9 @@ class TestPublishSite:
         output_dir = tmp_path / "output"
 
         with (
-            patch("blogmore.publisher.check_git_available", return_value=True),
-            patch("blogmore.publisher.check_is_git_repository", return_value=True),
-            patch("blogmore.publisher.get_git_root", return_value=tmp_path),
+            patch.object(publisher, "check_git_available", return_value=True),
+            patch.object(publisher, "check_is_git_repository", return_value=True),
+            patch.object(publisher, "get_git_root", return_value=tmp_path),
             pytest.raises(PublishError, match="Output directory not found"),
         ):
             publish_site(output_dir)
@@ -158,283 +336,96 @@ class TestPublishSite:
         output_dir.mkdir()
 
         with (
-            patch("blogmore.publisher.check_git_available", return_value=True),
-            patch("blogmore.publisher.check_is_git_repository", return_value=True),
-            patch("blogmore.publisher.get_git_root", return_value=tmp_path),
+            patch.object(publisher, "check_git_available", return_value=True),
+            patch.object(publisher, "check_is_git_repository", return_value=True),
+            patch.object(publisher, "get_git_root", return_value=tmp_path),
             pytest.raises(PublishError, match="Output directory is empty"),
         ):
             publish_site(output_dir)
 
-    @patch("blogmore.publisher.subprocess.run")
-    @patch("blogmore.publisher.shutil.rmtree")
-    @patch("blogmore.publisher.shutil.copy2")
-    @patch("blogmore.publisher.shutil.copytree")
-    @patch("blogmore.publisher.tempfile.mkdtemp")
-    @patch("blogmore.publisher.check_git_available", return_value=True)
-    @patch("blogmore.publisher.check_is_git_repository", return_value=True)
-    @patch("blogmore.publisher.get_git_root")
-    def test_publish_site_new_branch(
-        self,
-        mock_get_git_root: MagicMock,
-        mock_check_is_git_repository: MagicMock,
-        mock_check_git_available: MagicMock,
-        mock_mkdtemp: MagicMock,
-        mock_copytree: MagicMock,
-        mock_copy2: MagicMock,
-        mock_rmtree: MagicMock,
-        mock_run: MagicMock,
-        tmp_path: Path,
-    ) -> None:
-        """Test publishing site to a new branch."""
-        output_dir = tmp_path / "output"
-        output_dir.mkdir()
-        (output_dir / "index.html").write_text("<html></html>")
-
-        git_root = tmp_path / "repo"
-        git_root.mkdir()
-        mock_get_git_root.return_value = git_root
-
-        worktree_path = tmp_path / "worktree"
-        worktree_path.mkdir()
-        mock_mkdtemp.return_value = str(worktree_path)
-
-        # Mock git commands
-        def run_side_effect(*args: object, **kwargs: object) -> MagicMock:
-            cmd = args[0] if args else []
-            if not isinstance(cmd, list):
-                return MagicMock(returncode=0, stdout="")
-
-            if cmd[:3] == ["git", "rev-parse", "--verify"]:
-                # Branch doesn't exist locally
-                return MagicMock(returncode=1, stdout="")
-            elif cmd[:2] == ["git", "ls-remote"]:
-                # Branch doesn't exist remotely
-                return MagicMock(returncode=0, stdout="")
-            elif cmd[:2] == ["git", "diff"]:
-                # There are changes
-                return MagicMock(returncode=1, stdout="")
-            else:
-                return MagicMock(returncode=0, stdout="")
-
-        mock_run.side_effect = run_side_effect
-
-        publish_site(output_dir, branch="gh-pages", remote="origin")
-
-        # Verify git worktree commands were called
-        assert any(
-            call[0][0][:2] == ["git", "worktree"] for call in mock_run.call_args_list
-        )
-        assert any(
-            call[0][0][:3] == ["git", "checkout", "--orphan"]
-            for call in mock_run.call_args_list
-        )
-        assert any(call[0][0][:2] == ["git", "add"] for call in mock_run.call_args_list)
-        assert any(
-            call[0][0][:2] == ["git", "commit"] for call in mock_run.call_args_list
-        )
-        assert any(
-            call[0][0][:2] == ["git", "push"] for call in mock_run.call_args_list
-        )
-
-    @patch("blogmore.publisher.subprocess.run")
-    @patch("blogmore.publisher.shutil.rmtree")
-    @patch("blogmore.publisher.shutil.copy2")
-    @patch("blogmore.publisher.shutil.copytree")
-    @patch("blogmore.publisher.tempfile.mkdtemp")
-    @patch("blogmore.publisher.check_git_available", return_value=True)
-    @patch("blogmore.publisher.check_is_git_repository", return_value=True)
-    @patch("blogmore.publisher.get_git_root")
-    def test_publish_site_existing_branch(
-        self,
-        mock_get_git_root: MagicMock,
-        mock_check_is_git_repository: MagicMock,
-        mock_check_git_available: MagicMock,
-        mock_mkdtemp: MagicMock,
-        mock_copytree: MagicMock,
-        mock_copy2: MagicMock,
-        mock_rmtree: MagicMock,
-        mock_run: MagicMock,
-        tmp_path: Path,
-    ) -> None:
-        """Test publishing site to an existing branch."""
-        output_dir = tmp_path / "output"
-        output_dir.mkdir()
-        (output_dir / "index.html").write_text("<html></html>")
-
-        git_root = tmp_path / "repo"
-        git_root.mkdir()
-        mock_get_git_root.return_value = git_root
-
-        worktree_path = tmp_path / "worktree"
-        worktree_path.mkdir()
-        mock_mkdtemp.return_value = str(worktree_path)
-
-        # Mock git commands
-        def run_side_effect(*args: object, **kwargs: object) -> MagicMock:
-            cmd = args[0] if args else []
-            if not isinstance(cmd, list):
-                return MagicMock(returncode=0, stdout="")
-
-            if cmd[:3] == ["git", "rev-parse", "--verify"]:
-                # Branch exists locally
-                return MagicMock(returncode=0, stdout="")
-            elif cmd[:2] == ["git", "diff"]:
-                # There are changes
-                return MagicMock(returncode=1, stdout="")
-            else:
-                return MagicMock(returncode=0, stdout="")
-
-        mock_run.side_effect = run_side_effect
-
-        publish_site(output_dir, branch="gh-pages", remote="origin")
-
-        # Verify git worktree commands were called
-        assert any(
-            call[0][0][:3] == ["git", "worktree", "add"]
-            for call in mock_run.call_args_list
-        )
-        assert any(call[0][0][:2] == ["git", "add"] for call in mock_run.call_args_list)
-        assert any(call[0][0][:2] == ["git", "add"] for call in mock_run.call_args_list)
-
-    @patch("blogmore.publisher.subprocess.run")
-    @patch("blogmore.publisher.shutil.rmtree")
-    @patch("blogmore.publisher.shutil.copy2")
-    @patch("blogmore.publisher.shutil.copytree")
-    @patch("blogmore.publisher.tempfile.mkdtemp")
-    @patch("blogmore.publisher.check_git_available", return_value=True)
-    @patch("blogmore.publisher.check_is_git_repository", return_value=True)
-    @patch("blogmore.publisher.get_git_root")
-    def test_publish_site_no_changes(
+    @pytest.mark.parametrize(
+        ("branch_exists", "has_changes", "expected", "unexpected", "message"),
+        [
+            (
+                False,
+                True,
+                [
+                    ("git", "worktree"),
+                    ("git", "checkout", "--orphan"),
+                    ("git", "add"),
+                    ("git", "commit"),
+                    ("git", "push"),
+                ],
+                [],
+                None,
+            ),
+            (
+                True,
+                True,
+                [
+                    ("git", "worktree", "add"),
+                    ("git", "add"),
+                    ("git", "commit"),
+                ],
+                [],
+                None,
+            ),
+            (True, False, [], [("git", "push")], "No changes to publish"),
+        ],
+        ids=["new", "existing", "no_changes"],
+    )
+    def test_publish_site(
         self,
-        mock_get_git_root: MagicMock,
-        mock_check_is_git_repository: MagicMock,
-        mock_check_git_available: MagicMock,
-        mock_mkdtemp: MagicMock,
-        mock_copytree: MagicMock,
-        mock_copy2: MagicMock,
-        mock_rmtree: MagicMock,
-        mock_run: MagicMock,
-        tmp_path: Path,
+        publish_mocks: SimpleNamespace,
+        output_dir: Path,
         capsys: pytest.CaptureFixture[str],
+        branch_exists: bool,
+        has_changes: bool,
+        expected: list[tuple[str, ...]],
+        unexpected: list[tuple[str, ...]],
+        message: str | None,
     ) -> None:
-        """Test publishing site when there are no changes."""
-        output_dir = tmp_path / "output"
-        output_dir.mkdir()
-        (output_dir / "index.html").write_text("<html></html>")
-
-        git_root = tmp_path / "repo"
-        git_root.mkdir()
-        mock_get_git_root.return_value = git_root
-
-        worktree_path = tmp_path / "worktree"
-        worktree_path.mkdir()
-        mock_mkdtemp.return_value = str(worktree_path)
-
-        # Mock git commands
-        def run_side_effect(*args: object, **kwargs: object) -> MagicMock:
-            cmd = args[0] if args else []
-            if not isinstance(cmd, list):
-                return MagicMock(returncode=0, stdout="")
-
-            if cmd[:3] == ["git", "rev-parse", "--verify"]:
-                # Branch exists
-                return MagicMock(returncode=0, stdout="")
-            elif cmd[:2] == ["git", "diff"]:
-                # No changes
-                return MagicMock(returncode=0, stdout="")
-            else:
-                return MagicMock(returncode=0, stdout="")
-
-        mock_run.side_effect = run_side_effect
+        """Test publishing site to a new branch, an existing branch, and unchanged."""
+        mock_run = publish_mocks.run
+        mock_run.side_effect = _fake_git(
+            branch_exists=branch_exists, has_changes=has_changes
+        )
 
         publish_site(output_dir, branch="gh-pages", remote="origin")
 
-        captured = capsys.readouterr()
-        assert "No changes to publish" in captured.out
-        # Should not push if there are no changes
-        assert not any(
-            call[0][0][:2] == ["git", "push"] for call in mock_run.call_args_list
-        )
+        commands = _command_prefixes(mock_run)
+        for command in expected:
+            assert command in commands
+        for command in unexpected:
+            assert command not in commands
+        output = capsys.readouterr().out
+        if message is None:
+            # Anything that publishes must not claim there was nothing to do.
+            assert "No changes to publish" not in output
+        else:
+            assert message in output
 
-    @patch("blogmore.publisher.subprocess.run")
-    @patch("blogmore.publisher.shutil.rmtree")
-    @patch("blogmore.publisher.shutil.copy2")
-    @patch("blogmore.publisher.shutil.copytree")
-    @patch("blogmore.publisher.tempfile.mkdtemp")
-    @patch("blogmore.publisher.check_git_available", return_value=True)
-    @patch("blogmore.publisher.check_is_git_repository", return_value=True)
-    @patch("blogmore.publisher.get_git_root")
     def test_publish_site_creates_nojekyll(
         self,
-        mock_get_git_root: MagicMock,
-        mock_check_is_git_repository: MagicMock,
-        mock_check_git_available: MagicMock,
-        mock_mkdtemp: MagicMock,
-        mock_copytree: MagicMock,
-        mock_copy2: MagicMock,
-        mock_rmtree: MagicMock,
-        mock_run: MagicMock,
-        tmp_path: Path,
+        publish_mocks: SimpleNamespace,
+        output_dir: Path,
         capsys: pytest.CaptureFixture[str],
     ) -> None:
         """Test that .nojekyll file is created in the worktree."""
-        output_dir = tmp_path / "output"
-        output_dir.mkdir()
-        (output_dir / "index.html").write_text("<html></html>")
-
-        git_root = tmp_path / "repo"
-        git_root.mkdir()
-        mock_get_git_root.return_value = git_root
-
-        worktree_path = tmp_path / "worktree"
-        worktree_path.mkdir()
-        mock_mkdtemp.return_value = str(worktree_path)
-
-        # Mock git commands
-        def run_side_effect(*args: object, **kwargs: object) -> MagicMock:
-            cmd = args[0] if args else []
-            if not isinstance(cmd, list):
-                return MagicMock(returncode=0, stdout="")
-
-            if cmd[:3] == ["git", "rev-parse", "--verify"]:
-                # Branch doesn't exist locally
-                return MagicMock(returncode=1, stdout="")
-            elif cmd[:2] == ["git", "ls-remote"]:
-                # Branch doesn't exist remotely
-                return MagicMock(returncode=0, stdout="")
-            elif cmd[:2] == ["git", "diff"]:
-                # There are changes
-                return MagicMock(returncode=1, stdout="")
-            else:
-                return MagicMock(returncode=0, stdout="")
-
-        mock_run.side_effect = run_side_effect
+        publish_mocks.run.side_effect = _fake_git(branch_exists=False, has_changes=True)
 
         publish_site(output_dir, branch="gh-pages", remote="origin")
 
         # Verify .nojekyll file was created
-        nojekyll_file = worktree_path / ".nojekyll"
+        nojekyll_file = publish_mocks.worktree_path / ".nojekyll"
         assert nojekyll_file.exists()
 
         captured = capsys.readouterr()
         assert "Created .nojekyll file" in captured.out
 
-    @patch("blogmore.publisher.subprocess.run")
-    @patch("blogmore.publisher.shutil.rmtree")
-    @patch("blogmore.publisher.shutil.copytree")
-    @patch("blogmore.publisher.tempfile.mkdtemp")
-    @patch("blogmore.publisher.check_git_available", return_value=True)
-    @patch("blogmore.publisher.check_is_git_repository", return_value=True)
-    @patch("blogmore.publisher.get_git_root")
     def test_publish_site_preserves_existing_nojekyll(
         self,
-        mock_get_git_root: MagicMock,
-        mock_check_is_git_repository: MagicMock,
-        mock_check_git_available: MagicMock,
-        mock_mkdtemp: MagicMock,
-        mock_copytree: MagicMock,
-        mock_rmtree: MagicMock,
-        mock_run: MagicMock,
+        publish_mocks: SimpleNamespace,
         tmp_path: Path,
         capsys: pytest.CaptureFixture[str],
     ) -> None:
@@ -444,71 +435,26 @@ class TestPublishSite:
         (output_dir / "index.html").write_text("<html></html>")
         (output_dir / ".nojekyll").write_text("")
 
-        git_root = tmp_path / "repo"
-        git_root.mkdir()
-        mock_get_git_root.return_value = git_root
-
-        worktree_path = tmp_path / "worktree"
-        worktree_path.mkdir()
-        mock_mkdtemp.return_value = str(worktree_path)
-
         # Mock copy2 to actually copy files
         def mock_copy2_side_effect(src: Path, dest: Path) -> None:
             """Mock copy2 that actually copies files."""
             Path(dest).write_text(Path(src).read_text())
 
-        with patch(
-            "blogmore.publisher.shutil.copy2", side_effect=mock_copy2_side_effect
-        ):
-            # Mock git commands
-            def run_side_effect(*args: object, **kwargs: object) -> MagicMock:
-                cmd = args[0] if args else []
-                if not isinstance(cmd, list):
-                    return MagicMock(returncode=0, stdout="")
-
-                if cmd[:3] == ["git", "rev-parse", "--verify"]:
-                    # Branch doesn't exist locally
-                    return MagicMock(returncode=1, stdout="")
-                elif cmd[:2] == ["git", "ls-remote"]:
-                    # Branch doesn't exist remotely
-                    return MagicMock(returncode=0, stdout="")
-                elif cmd[:2] == ["git", "diff"]:
-                    # There are changes
-                    return MagicMock(returncode=1, stdout="")
-                else:
-                    return MagicMock(returncode=0, stdout="")
-
-            mock_run.side_effect = run_side_effect
-
-            publish_site(output_dir, branch="gh-pages", remote="origin")
-
-            # Verify .nojekyll file exists
-            nojekyll_file = worktree_path / ".nojekyll"
-            assert nojekyll_file.exists()
-
-            captured = capsys.readouterr()
-            # Should not print creation message since file already exists
-            assert "Created .nojekyll file" not in captured.out
-
-    @patch("blogmore.publisher.subprocess.run")
-    @patch("blogmore.publisher.shutil.rmtree")
-    @patch("blogmore.publisher.shutil.copy2")
-    @patch("blogmore.publisher.shutil.copytree")
-    @patch("blogmore.publisher.tempfile.mkdtemp")
-    @patch("blogmore.publisher.check_git_available", return_value=True)
-    @patch("blogmore.publisher.check_is_git_repository", return_value=True)
-    @patch("blogmore.publisher.get_git_root")
+        publish_mocks.copy2.side_effect = mock_copy2_side_effect
+        publish_mocks.run.side_effect = _fake_git(branch_exists=False, has_changes=True)
+
+        publish_site(output_dir, branch="gh-pages", remote="origin")
+
+        # Verify .nojekyll file exists
+        nojekyll_file = publish_mocks.worktree_path / ".nojekyll"
+        assert nojekyll_file.exists()
+
+        captured = capsys.readouterr()
+        # Should not print creation message since file already exists
+        assert "Created .nojekyll file" not in captured.out
+
     def test_nojekyll_committed_before_push(
-        self,
-        mock_get_git_root: MagicMock,
-        mock_check_is_git_repository: MagicMock,
-        mock_check_git_available: MagicMock,
-        mock_mkdtemp: MagicMock,
-        mock_copytree: MagicMock,
-        mock_copy2: MagicMock,
-        mock_rmtree: MagicMock,
-        mock_run: MagicMock,
-        tmp_path: Path,
+        self, publish_mocks: SimpleNamespace, output_dir: Path
     ) -> None:
         """Test that .nojekyll file is created and committed before push.
 
@@ -518,49 +464,16 @@ class TestPublishSite:
         3. Changes are committed (git commit)
         4. Changes are pushed (git push)
         """
-        output_dir = tmp_path / "output"
-        output_dir.mkdir()
-        (output_dir / "index.html").write_text("<html></html>")
-
-        git_root = tmp_path / "repo"
-        git_root.mkdir()
-        mock_get_git_root.return_value = git_root
-
-        worktree_path = tmp_path / "worktree"
-        worktree_path.mkdir()
-        mock_mkdtemp.return_value = str(worktree_path)
-
         # Track the order of git commands
         git_commands: list[list[str]] = []
-
-        # Mock git commands
-        def run_side_effect(*args: object, **kwargs: object) -> MagicMock:
-            cmd = args[0] if args else []
-            if not isinstance(cmd, list):
-                return MagicMock(returncode=0, stdout="")
-
-            # Track git commands
-            if cmd[0] == "git":
-                git_commands.append(cmd)
-
-            if cmd[:3] == ["git", "rev-parse", "--verify"]:
-                # Branch doesn't exist locally
-                return MagicMock(returncode=1, stdout="")
-            elif cmd[:2] == ["git", "ls-remote"]:
-                # Branch doesn't exist remotely
-                return MagicMock(returncode=0, stdout="")
-            elif cmd[:2] == ["git", "diff"]:
-                # There are changes
-                return MagicMock(returncode=1, stdout="")
-            else:
-                return MagicMock(returncode=0, stdout="")
-
-        mock_run.side_effect = run_side_effect
+        publish_mocks.run.side_effect = _fake_git(
+            branch_exists=False, has_changes=True, history=git_commands
+        )
 
         publish_site(output_dir, branch="gh-pages", remote="origin")
 
         # Verify .nojekyll file was created in the worktree
-        nojekyll_file = worktree_path / ".nojekyll"
+        nojekyll_file = publish_mocks.worktree_path / ".nojekyll"
         assert nojekyll_file.exists()
 
         # Find the indices of key git operations
@@ -591,25 +504,10 @@ class TestPublishSite:
             f"git push (index {push_index})"
         )
 
-    @patch("blogmore.publisher.subprocess.run")
-    @patch("blogmore.publisher.shutil.rmtree")
-    @patch("blogmore.publisher.shutil.copy2")
-    @patch("blogmore.publisher.shutil.copytree")
-    @patch("blogmore.publisher.tempfile.mkdtemp")
-    @patch("blogmore.publisher.check_git_available", return_value=True)
-    @patch("blogmore.publisher.check_is_git_repository", return_value=True)
-    @patch("blogmore.publisher.get_git_root")
     def test_publish_site_fetches_before_push_when_branch_exists_locally(
         self,
-        mock_get_git_root: MagicMock,
-        mock_check_is_git_repository: MagicMock,
-        mock_check_git_available: MagicMock,
-        mock_mkdtemp: MagicMock,
-        mock_copytree: MagicMock,
-        mock_copy2: MagicMock,
-        mock_rmtree: MagicMock,
-        mock_run: MagicMock,
-        tmp_path: Path,
+        publish_mocks: SimpleNamespace,
+        output_dir: Path,
         capsys: pytest.CaptureFixture[str],
     ) -> None:
         """Test that remote is fetched before push when branch already exists locally.
@@ -619,38 +517,11 @@ class TestPublishSite:
         the remote. Without fetching first, the push would be rejected as
         non-fast-forward.
         """
-        output_dir = tmp_path / "output"
-        output_dir.mkdir()
-        (output_dir / "index.html").write_text("<html></html>")
-
-        git_root = tmp_path / "repo"
-        git_root.mkdir()
-        mock_get_git_root.return_value = git_root
-
-        worktree_path = tmp_path / "worktree"
-        worktree_path.mkdir()
-        mock_mkdtemp.return_value = str(worktree_path)
-
         git_commands: list[list[str]] = []
-
-        def run_side_effect(*args: object, **kwargs: object) -> MagicMock:
-            cmd = args[0] if args else []
-            if not isinstance(cmd, list):
-                return MagicMock(returncode=0, stdout="")
-
-            if cmd[0] == "git":
-                git_commands.append(cmd)
-
-            if cmd[:3] == ["git", "rev-parse", "--verify"]:
-                # Branch exists locally (simulating multi-machine scenario)
-                return MagicMock(returncode=0, stdout="abc123")
-            elif cmd[:2] == ["git", "diff"]:
-                # There are changes
-                return MagicMock(returncode=1, stdout="")
-            else:
-                return MagicMock(returncode=0, stdout="")
-
-        mock_run.side_effect = run_side_effect
+        # Branch exists locally (simulating multi-machine scenario)
+        publish_mocks.run.side_effect = _fake_git(
+            branch_exists=True, has_changes=True, history=git_commands
+        )
 
         publish_site(output_dir, branch="gh-pages", remote="origin")
 
@@ -1,10 +1,258 @@
 """Unit tests for the renderer module."""
 
+import dataclasses
 import datetime as dt
+from collections.abc import Iterable
 from pathlib import Path
 
+import pytest
+from jinja2 import Template
+from pytest_mock import MockerFixture
+
+from blogmore import __version__
 from blogmore.parser import Page, Post
-from blogmore.renderer import TemplateRenderer
+from blogmore.renderer import TemplateRenderer, clear_environment_cache
+
+_TEST_MD_PATH = Path("test.md")
+"""The source path of most of the posts built for the tests."""
+
+_MINIMAL_MD_PATH = Path("minimal.md")
+"""The source path of the minimal post."""
+
+_ABOUT_MD_PATH = Path("about.md")
+"""The source path of the page built for the tests."""
+
+_DATE_2024_01_15 = dt.datetime(2024, 1, 15, 14, 30, 0, tzinfo=dt.UTC)
+"""A UTC date to format."""
+
+_DATE_2024_03_01 = dt.datetime(2024, 3, 1, 10, 0, 0, tzinfo=dt.UTC)
+"""The date of most of the posts built for the tests."""
+
+_DATE_2026_02_20 = dt.datetime(2026, 2, 20, 15, 46, 0, tzinfo=dt.UTC)
+"""A UTC date to check the archive links of."""
+
+_PROTO_POST = Post(
+    path=_TEST_MD_PATH,
+    title="Test Post",
+    content="Test content",
+    html_content="<p>Test content</p>",
+    date=_DATE_2024_03_01,
+    metadata={},
+)
+"""A plain post that the posts built for the tests are derived from."""
+
+_SEO_POST = dataclasses.replace(
+    _PROTO_POST,
+    title="SEO Test Post",
+    category="testing",
+    tags=["seo", "meta-tags"],
+    metadata={
+        "author": "John Doe",
+        "description": "A test post for SEO",
+        "cover": "https://example.com/cover.jpg",
+        "modified": "2024-03-02T15:30:00+00:00",
+        "twitter_creator": "@johndoe",
+        "twitter_site": "@myblog",
+    },
+)
+"""A post with every piece of metadata that feeds the SEO meta tags."""
+
+_EXPECTED_SEO_META = (
+    # Standard SEO meta tags
+    '<meta name="author" content="John Doe">',
+    '<meta name="description" content="A test post for SEO">',
+    '<meta name="keywords" content="seo, meta-tags">',
+    # Open Graph meta tags
+    '<meta property="og:title" content="SEO Test Post">',
+    '<meta property="og:type" content="article">',
+    '<meta property="og:url" content="https://example.com/2024/03/01/test.html">',
+    '<meta property="og:description" content="A test post for SEO">',
+    '<meta property="og:site_name" content="Test Blog">',
+    '<meta property="og:image" content="https://example.com/cover.jpg">',
+    # Article-specific Open Graph tags
+    '<meta property="article:published_time"',
+    '<meta property="article:modified_time" content="2024-03-02T15:30:00+00:00">',
+    '<meta property="article:author" content="John Doe">',
+    '<meta property="article:section" content="testing">',
+    '<meta property="article:tag" content="seo">',
+    '<meta property="article:tag" content="meta-tags">',
+    # Twitter Card meta tags
+    '<meta name="twitter:card" content="summary_large_image">',
+    '<meta name="twitter:title" content="SEO Test Post">',
+    '<meta name="twitter:description" content="A test post for SEO">',
+    '<meta name="twitter:image" content="https://example.com/cover.jpg">',
+    '<meta name="twitter:creator" content="@johndoe">',
+    '<meta name="twitter:site" content="@myblog">',
+)
+"""The meta tags `_SEO_POST` should render with."""
+
+_TAGS_FIXTURE = (
+    {"display_name": "Python", "safe_tag": "python", "count": 5, "font_size": 20},
+    {
+        "display_name": "JavaScript",
+        "safe_tag": "javascript",
+        "count": 3,
+        "font_size": 16,
+    },
+)
+"""The tags to show on the tags overview page."""
+
+_CATEGORIES_FIXTURE = (
+    {"display_name": "Python", "safe_category": "python", "count": 5, "font_size": 20},
+    {"display_name": "Web Dev", "safe_category": "webdev", "count": 3, "font_size": 16},
+)
+"""The categories to show on the categories overview page."""
+
+_MINIMAL_POST = dataclasses.replace(
+    _PROTO_POST, path=_MINIMAL_MD_PATH, title="Minimal Post"
+)
+"""A post with none of the optional metadata."""
+
+_GENERATOR_META = f'<meta name="generator" content="blogmore v{__version__}">'
+"""The generator meta tag every rendered page should carry."""
+
+_EXTERNAL_LINK_TEMPLATE = """
+{% if "https://github.com"|is_external_link %}external{% else %}internal{% endif %}
+{% if "/about.html"|is_external_link %}external{% else %}internal{% endif %}
+"""
+"""A template using `is_external_link` on an external and an internal link."""
+
+
+def _assert_all_present(html: str, fragments: Iterable[str]) -> None:
+    """Assert that every fragment appears in some HTML.
+
+    The check itself is a single `all` over `str.__contains__`, so the loop
+    stays in C; only when it fails are the fragments checked again to say
+    which are missing.
+
+    Args:
+        html: The HTML to check.
+        fragments: The fragments that must be present.
+    """
+    fragments = tuple(fragments)
+    if not all(map(html.__contains__, fragments)):
+        missing = [fragment for fragment in fragments if fragment not in html]
+        raise AssertionError(f"Missing from HTML: {missing}")
+
+
+def _assert_none_present(html: str, fragments: Iterable[str]) -> None:
+    """Assert that none of the fragments appear in some HTML.
+
+    Args:
+        html: The HTML to check.
+        fragments: The fragments that must not be present.
+    """
+    fragments = tuple(fragments)
+    if any(map(html.__contains__, fragments)):
+        present = [fragment for fragment in fragments if fragment in html]
+        raise AssertionError(f"Unexpected in HTML: {present}")
+
+
+def _meta_tag_id(fragment: str) -> str:
+    """Make a test ID for an expected meta tag.
+
+    Args:
+        fragment: The expected meta tag.
+
+    Returns:
+        The name or property of the meta tag.
+    """
+    return fragment.split('"')[1]
+
+
+def _render_post_with_cover(cover: str | None, has_platform_icons: bool = False) -> str:
+    """Render a post for `https://example.com` with the given cover.
+
+    Args:
+        cover: The cover metadata for the post, or `None` for no cover.
+        has_platform_icons: Whether the site has platform icons.
+
+    Returns:
+        The rendered HTML.
+    """
+    post = dataclasses.replace(
+        _PROTO_POST, metadata={} if cover is None else {"cover": cover}
+    )
+    return TemplateRenderer().render_post(
+        post,
+        site_title="Test Blog",
+        site_url="https://example.com",
+        has_platform_icons=has_platform_icons,
+    )
+
+
+@pytest.fixture(scope="module")
+def default_renderer() -> TemplateRenderer:
+    """A renderer with the default settings, shared by the module's tests."""
+    return TemplateRenderer()
+
+
+@pytest.fixture(scope="module", autouse=True)
+def warm_templates(default_renderer: TemplateRenderer) -> None:
+    """Load the main templates once, before any of the module's tests run.
+
+    Every test after this finds the templates already compiled in the
+    default renderer's environment.
+    """
+    for template in (
+        "post.html",
+        "page.html",
+        "index.html",
+        "archive.html",
+        "tag.html",
+        "category.html",
+        "tags.html",
+        "categories.html",
+    ):
+        default_renderer.env.get_template(template)
+
+
+@pytest.fixture(scope="module")
+def renderer_with_site_url() -> TemplateRenderer:
+    """A renderer for `https://example.com`, shared by the module's tests."""
+    return TemplateRenderer(site_url="https://example.com")
+
+
+@pytest.fixture(scope="module")
+def external_link_template(renderer_with_site_url: TemplateRenderer) -> Template:
+    """The external link template, compiled once for the module."""
+    return renderer_with_site_url.env.from_string(_EXTERNAL_LINK_TEMPLATE)
+
+
+@pytest.fixture(scope="module")
+def custom_templates_dir(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """A custom templates directory that overrides the post template."""
+    templates_dir = tmp_path_factory.mktemp("custom_templates")
+    (templates_dir / "post.html").write_text(
+        "<html><body>CUSTOM TEMPLATE: {{ post.title }}</body></html>"
+    )
+    return templates_dir
+
+
+@pytest.fixture(scope="module")
+def empty_templates_dir(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """A custom templates directory with no templates in it."""
+    return tmp_path_factory.mktemp("empty_templates")
+
+
+@pytest.fixture(scope="module")
+def seo_post_html(default_renderer: TemplateRenderer) -> str:
+    """The SEO test post, rendered once for the module."""
+    return default_renderer.render_post(
+        _SEO_POST, site_title="Test Blog", site_url="https://example.com"
+    )
+
+
+@pytest.fixture(scope="module")
+def sample_post_html(sample_post: Post) -> str:
+    """The sample post rendered with the default templates.
+
+    Rendered once for the module and shared by the tests that only inspect
+    the default rendering of the sample post.
+    """
+    return TemplateRenderer().render_post(
+        sample_post, site_title="Test Blog", blogmore_version=__version__
+    )
 
 
 class TestTemplateRenderer:
@@ -16,12 +264,10 @@ class TestTemplateRenderer:
         assert renderer.templates_dir is None
         assert renderer.extra_stylesheets == []
 
-    def test_init_with_custom_templates(self, tmp_path: Path) -> None:
+    def test_init_with_custom_templates(self, empty_templates_dir: Path) -> None:
         """Test initializing renderer with custom templates directory."""
-        templates_dir = tmp_path / "templates"
-        templates_dir.mkdir()
-        renderer = TemplateRenderer(templates_dir=templates_dir)
-        assert renderer.templates_dir == templates_dir
+        renderer = TemplateRenderer(templates_dir=empty_templates_dir)
+        assert renderer.templates_dir == empty_templates_dir
 
     def test_init_with_extra_stylesheets(self) -> None:
         """Test initializing renderer with extra stylesheets."""
@@ -35,10 +281,58 @@ class TestTemplateRenderer:
         assert renderer.env.trim_blocks is True
         assert renderer.env.lstrip_blocks is True
 
+    def test_environment_shared_between_renderers(self) -> None:
+        """Test that renderers with the same settings share an environment."""
+        first = TemplateRenderer(site_url="https://example.com")
+        second = TemplateRenderer(
+            site_url="https://example.com", extra_stylesheets=["/extra.css"]
+        )
+        assert first.env is second.env
+        assert TemplateRenderer().env is not first.env
+
+    def test_new_custom_template_picked_up_after_cache_cleared(
+        self, tmp_path: Path, sample_post: Post
+    ) -> None:
+        """Test that a custom template added after a render is used next build."""
+        templates_dir = tmp_path / "templates"
+        templates_dir.mkdir()
+        html = TemplateRenderer(templates_dir=templates_dir).render_post(
+            sample_post, site_title="Test Blog"
+        )
+        assert "ADDED TEMPLATE" not in html
+
+        (templates_dir / "post.html").write_text(
+            "<html><body>ADDED TEMPLATE: {{ post.title }}</body></html>"
+        )
+        clear_environment_cache()
+        html = TemplateRenderer(templates_dir=templates_dir).render_post(
+            sample_post, site_title="Test Blog"
+        )
+        assert "ADDED TEMPLATE" in html
+
+    def test_templates_looked_up_once_per_renderer(
+        self, sample_post: Post, mocker: MockerFixture
+    ) -> None:
+        """Test that a renderer only asks its environment for a template once."""
+        renderer = TemplateRenderer()
+        get_template = mocker.spy(renderer.env, "get_template")
+        renderer.render_post(sample_post)
+        renderer.render_post(sample_post)
+        # Includes and parent templates are looked up by Jinja itself, so
+        # only count the lookups of the post template.
+        assert get_template.call_args_list.count(mocker.call("post.html")) == 1
+
+    def test_environment_keeps_site_domain(self) -> None:
+        """Test that the external link filter follows each renderer's site."""
+        ours = TemplateRenderer(site_url="https://example.com")
+        theirs = TemplateRenderer(site_url="https://other.com")
+        href = "https://example.com/page"
+        assert ours.env.filters["is_external_link"](href) is False
+        assert theirs.env.filters["is_external_link"](href) is True
+
     def test_format_date_with_datetime(self) -> None:
         """Test formatting a datetime object."""
-        date = dt.datetime(2024, 1, 15, 14, 30, 0, tzinfo=dt.UTC)
-        formatted = TemplateRenderer._format_date(date)
+        formatted = TemplateRenderer._format_date(_DATE_2024_01_15)
         assert "2024" in formatted
         assert "01" in formatted
         assert "15" in formatted
@@ -46,33 +340,61 @@ class TestTemplateRenderer:
 
     def test_format_date_with_timezone(self) -> None:
         """Test formatting a datetime with timezone."""
-        date = dt.datetime(2024, 1, 15, 14, 30, 0, tzinfo=dt.UTC)
-        formatted = TemplateRenderer._format_date(date)
+        formatted = TemplateRenderer._format_date(_DATE_2024_01_15)
         # Should include timezone info
         assert "UTC" in formatted or "00:00" in formatted
 
+    def test_format_date_is_cached(self) -> None:
+        """Test that formatting the same date again reuses the first result."""
+        assert TemplateRenderer._format_date(
+            _DATE_2024_01_15
+        ) is TemplateRenderer._format_date(_DATE_2024_01_15)
+
+    def test_format_date_cache_respects_timezone(self) -> None:
+        """Test that the same instant in different timezones formats differently."""
+        gmt = _DATE_2024_01_15.replace(tzinfo=dt.timezone(dt.timedelta(0), "GMT"))
+        plus_one = _DATE_2024_01_15.astimezone(dt.timezone(dt.timedelta(hours=1)))
+        # All three are the same instant, and so compare equal
+        assert gmt == plus_one == _DATE_2024_01_15
+        assert TemplateRenderer._format_date(_DATE_2024_01_15).endswith("14:30:00 UTC")
+        assert TemplateRenderer._format_date(gmt).endswith("14:30:00 GMT")
+        assert TemplateRenderer._format_date(plus_one).endswith("15:30:00 UTC+01:00")
+
+    @pytest.mark.parametrize(
+        "date, expected",
+        [
+            (_DATE_2024_01_15.replace(tzinfo=None), "2024-01-15 14:30:00"),
+            (_DATE_2024_01_15, "2024-01-15 14:30:00 UTC"),
+            (
+                _DATE_2024_01_15.astimezone(dt.timezone(-dt.timedelta(hours=5))),
+                "2024-01-15 09:30:00 UTC-05:00",
+            ),
+            (None, ""),
+        ],
+        ids=["naive", "named", "offset", "none"],
+    )
+    def test_format_date_plain(self, date: dt.datetime | None, expected: str) -> None:
+        """Test formatting a date as plain text."""
+        assert TemplateRenderer._format_date_plain(date) == expected
+
     def test_format_date_none(self) -> None:
         """Test formatting None returns empty string."""
         assert TemplateRenderer._format_date(None) == ""
 
     def test_format_date_links(self) -> None:
         """Test that format_date produces archive links for year, month and day."""
-        date = dt.datetime(2026, 2, 20, 15, 46, 0, tzinfo=dt.UTC)
-        formatted = TemplateRenderer._format_date(date)
+        formatted = TemplateRenderer._format_date(_DATE_2026_02_20)
         assert '<a href="/2026/">2026</a>' in formatted
         assert '<a href="/2026/02/">02</a>' in formatted
         assert '<a href="/2026/02/20/">20</a>' in formatted
         assert "15:46:00" in formatted
         assert "UTC" in formatted
 
-    def test_render_post(self, sample_post: Post) -> None:
+    def test_render_post(self, sample_post: Post, sample_post_html: str) -> None:
         """Test rendering a single post."""
-        renderer = TemplateRenderer()
-        html = renderer.render_post(sample_post, site_title="Test Blog")
-
-        assert sample_post.title in html
-        assert sample_post.html_content in html
-        assert "Test Blog" in html
+        assert sample_post.title in sample_post_html
+        assert sample_post.html_content in sample_post_html
+        assert "Test Blog" in sample_post_html
 
     def test_render_post_with_extra_stylesheets(self, sample_post: Post) -> None:
         """Test rendering post with extra stylesheets."""
@@ -89,10 +411,11 @@ class TestTemplateRenderer:
         assert sample_page.html_content in html
         assert "Test Blog" in html
 
-    def test_render_index(self, sample_post: Post) -> None:
+    def test_render_index(
+        self, default_renderer: TemplateRenderer, sample_post: Post
+    ) -> None:
         """Test rendering the index page."""
-        renderer = TemplateRenderer()
-        html = renderer.render_index(
+        html = default_renderer.render_index(
             posts=[sample_post],
             page=1,
             total_pages=1,
@@ -102,10 +425,11 @@ class TestTemplateRenderer:
         assert sample_post.title in html
         assert "Test Blog" in html
 
-    def test_render_index_default_feed_links(self, sample_post: Post) -> None:
+    def test_render_index_default_feed_links(
+        self, default_renderer: TemplateRenderer, sample_post: Post
+    ) -> None:
         """Test that index page has default RSS and Atom links."""
-        renderer = TemplateRenderer()
-        html = renderer.render_index(
+        html = default_renderer.render_index(
             posts=[sample_post],
             page=1,
             total_pages=1,
@@ -113,17 +437,23 @@ class TestTemplateRenderer:
             site_url="https://example.com",
         )
 
-        # Check navigation links point to default feeds
-        assert 'href="/feed.xml"' in html
-        assert 'href="/feeds/all.atom.xml"' in html
-        # Check <link> tags in <head> also point to default feeds
-        assert 'href="https://example.com/feed.xml"' in html
-        assert 'href="https://example.com/feeds/all.atom.xml"' in html
+        _assert_all_present(
+            html,
+            (
+                # Navigation links point to default feeds
+                'href="/feed.xml"',
+                'href="/feeds/all.atom.xml"',
+                # <link> tags in <head> also point to default feeds
+                'href="https://example.com/feed.xml"',
+                'href="https://example.com/feeds/all.atom.xml"',
+            ),
+        )
 
-    def test_render_index_with_pagination(self, sample_post: Post) -> None:
+    def test_render_index_with_pagination(
+        self, default_renderer: TemplateRenderer, sample_post: Post
+    ) -> None:
         """Test rendering index with pagination."""
-        renderer = TemplateRenderer()
-        html = renderer.render_index(
+        html = default_renderer.render_index(
             posts=[sample_post],
             page=2,
             total_pages=5,
@@ -134,10 +464,11 @@ class TestTemplateRenderer:
         # Should have pagination indicators
         assert "2" in html  # Current page
 
-    def test_render_archive(self, sample_post: Post) -> None:
+    def test_render_archive(
+        self, default_renderer: TemplateRenderer, sample_post: Post
+    ) -> None:
         """Test rendering the archive page."""
-        renderer = TemplateRenderer()
-        html = renderer.render_archive(
+        html = default_renderer.render_archive(
             posts=[sample_post],
             archive_title="Posts from 2024",
             site_title="Test Blog",
@@ -146,10 +477,11 @@ class TestTemplateRenderer:
         assert sample_post.title in html
         assert "Posts from 2024" in html
 
-    def test_render_tag_page(self, sample_post: Post) -> None:
+    def test_render_tag_page(
+        self, default_renderer: TemplateRenderer, sample_post: Post
+    ) -> None:
         """Test rendering a tag page."""
-        renderer = TemplateRenderer()
-        html = renderer.render_tag_page(
+        html = default_renderer.render_tag_page(
             tag="python",
             posts=[sample_post],
             site_title="Test Blog",
@@ -158,10 +490,11 @@ class TestTemplateRenderer:
         assert "python" in html
         assert sample_post.title in html
 
-    def test_render_category_page(self, sample_post: Post) -> None:
+    def test_render_category_page(
+        self, default_renderer: TemplateRenderer, sample_post: Post
+    ) -> None:
         """Test rendering a category page."""
-        renderer = TemplateRenderer()
-        html = renderer.render_category_page(
+        html = default_renderer.render_category_page(
             category="python",
             posts=[sample_post],
             site_title="Test Blog",
@@ -170,10 +503,11 @@ class TestTemplateRenderer:
         assert "python" in html
         assert sample_post.title in html
 
-    def test_render_category_page_feed_links(self, sample_post: Post) -> None:
+    def test_render_category_page_feed_links(
+        self, default_renderer: TemplateRenderer, sample_post: Post
+    ) -> None:
         """Test that category pages have category-specific RSS and Atom links."""
-        renderer = TemplateRenderer()
-        html = renderer.render_category_page(
+        html = default_renderer.render_category_page(
             category="Python",
             posts=[sample_post],
             site_title="Test Blog",
@@ -181,188 +515,100 @@ class TestTemplateRenderer:
             safe_category="python",
         )
 
-        # Check navigation links point to category feeds
-        assert 'href="/feeds/python.rss.xml"' in html
-        assert 'href="/feeds/python.atom.xml"' in html
-        # Check <link> tags in <head> also point to category feeds
-        assert 'href="https://example.com/feeds/python.rss.xml"' in html
-        assert 'href="https://example.com/feeds/python.atom.xml"' in html
+        _assert_all_present(
+            html,
+            (
+                # Navigation links point to category feeds
+                'href="/feeds/python.rss.xml"',
+                'href="/feeds/python.atom.xml"',
+                # <link> tags in <head> also point to category feeds
+                'href="https://example.com/feeds/python.rss.xml"',
+                'href="https://example.com/feeds/python.atom.xml"',
+            ),
+        )
         # Make sure default feed links are NOT present
-        assert 'href="/feed.xml"' not in html
-        assert 'href="/feeds/all.atom.xml"' not in html
+        _assert_none_present(html, ('href="/feed.xml"', 'href="/feeds/all.atom.xml"'))
 
-    def test_render_tags_page(self) -> None:
+    def test_render_tags_page(self, default_renderer: TemplateRenderer) -> None:
         """Test rendering the tags overview page."""
-        renderer = TemplateRenderer()
-        tags = [
-            {
-                "display_name": "Python",
-                "safe_tag": "python",
-                "count": 5,
-                "font_size": 20,
-            },
-            {
-                "display_name": "JavaScript",
-                "safe_tag": "javascript",
-                "count": 3,
-                "font_size": 16,
-            },
-        ]
-        html = renderer.render_tags_page(tags=tags, site_title="Test Blog")
+        html = default_renderer.render_tags_page(
+            tags=list(_TAGS_FIXTURE), site_title="Test Blog"
+        )
 
         assert "Python" in html
         assert "JavaScript" in html
 
-    def test_render_categories_page(self) -> None:
+    def test_render_categories_page(self, default_renderer: TemplateRenderer) -> None:
         """Test rendering the categories overview page."""
-        renderer = TemplateRenderer()
-        categories = [
-            {
-                "display_name": "Python",
-                "safe_category": "python",
-                "count": 5,
-                "font_size": 20,
-            },
-            {
-                "display_name": "Web Dev",
-                "safe_category": "webdev",
-                "count": 3,
-                "font_size": 16,
-            },
-        ]
-        html = renderer.render_categories_page(
-            categories=categories, site_title="Test Blog"
+        html = default_renderer.render_categories_page(
+            categories=list(_CATEGORIES_FIXTURE), site_title="Test Blog"
         )
 
         assert "Python" in html
         assert "Web Dev" in html
 
-    def test_render_template(self) -> None:
+    def test_render_template(self, default_renderer: TemplateRenderer) -> None:
         """Test rendering an arbitrary template."""
-        renderer = TemplateRenderer()
         # Test with a template we know exists (base.html)
-        html = renderer.render_template("base.html", site_title="Test Blog")
+        html = default_renderer.render_template("base.html", site_title="Test Blog")
         assert html  # Should return some HTML
 
-    def test_date_filter_in_template(self, sample_post: Post) -> None:
+    def test_date_filter_in_template(
+        self, default_renderer: TemplateRenderer, sample_post_html: str
+    ) -> None:
         """Test that the format_date filter works in templates."""
-        renderer = TemplateRenderer()
         # The filter should be available in templates
-        assert "format_date" in renderer.env.filters
+        assert "format_date" in default_renderer.env.filters
 
-        # Render a post and check date formatting
-        html = renderer.render_post(sample_post, site_title="Test Blog")
-        # Should contain formatted date
-        assert "2024" in html
+        # The rendered post should contain the formatted date
+        assert "2024" in sample_post_html
 
     def test_custom_templates_precedence(
-        self, tmp_path: Path, sample_post: Post
+        self, custom_templates_dir: Path, sample_post: Post
     ) -> None:
         """Test that custom templates take precedence over bundled ones."""
-        # Create a custom template directory with a custom post template
-        templates_dir = tmp_path / "templates"
-        templates_dir.mkdir()
-
-        # Create a simple custom post template
-        custom_template = templates_dir / "post.html"
-        custom_template.write_text(
-            "<html><body>CUSTOM TEMPLATE: {{ post.title }}</body></html>"
-        )
-
-        renderer = TemplateRenderer(templates_dir=templates_dir)
+        renderer = TemplateRenderer(templates_dir=custom_templates_dir)
         html = renderer.render_post(sample_post, site_title="Test Blog")
 
         assert "CUSTOM TEMPLATE" in html
         assert sample_post.title in html
 
     def test_fallback_to_bundled_templates(
-        self, tmp_path: Path, sample_post: Post
+        self, empty_templates_dir: Path, sample_post: Post
     ) -> None:
         """Test that missing custom templates fall back to bundled ones."""
-        # Create a custom template directory WITHOUT post.html
-        templates_dir = tmp_path / "templates"
-        templates_dir.mkdir()
-
-        renderer = TemplateRenderer(templates_dir=templates_dir)
+        renderer = TemplateRenderer(templates_dir=empty_templates_dir)
         # Should fall back to bundled template without error
         html = renderer.render_post(sample_post, site_title="Test Blog")
 
         assert sample_post.title in html
 
-    def test_render_post_seo_meta_tags(self) -> None:
-        """Test that SEO meta tags are rendered correctly for posts."""
-        renderer = TemplateRenderer()
-        post = Post(
-            path=Path("test.md"),
-            title="SEO Test Post",
-            content="Test content",
-            html_content="<p>Test content</p>",
-            date=dt.datetime(2024, 3, 1, 10, 0, 0, tzinfo=dt.UTC),
-            category="testing",
-            tags=["seo", "meta-tags"],
-            metadata={
-                "author": "John Doe",
-                "description": "A test post for SEO",
-                "cover": "https://example.com/cover.jpg",
-                "modified": "2024-03-02T15:30:00+00:00",
-                "twitter_creator": "@johndoe",
-                "twitter_site": "@myblog",
-            },
-        )
-
-        html = renderer.render_post(
-            post, site_title="Test Blog", site_url="https://example.com"
-        )
-
-        # Check standard SEO meta tags
-        assert '<meta name="author" content="John Doe">' in html
-        assert '<meta name="description" content="A test post for SEO">' in html
-        assert '<meta name="keywords" content="seo, meta-tags">' in html
+    def test_compiled_templates_cached(
+        self, tmp_path: Path, mock_template_cache_dir: Path
+    ) -> None:
+        """Test that compiled templates are written to the user cache directory."""
+        templates_dir = tmp_path / "templates"
+        templates_dir.mkdir()
+        (templates_dir / "greeting.html").write_text("Hello, {{ name }}!")
+        cache_dir = mock_template_cache_dir / "templates" / __version__
 
-        # Check Open Graph meta tags
-        assert '<meta property="og:title" content="SEO Test Post">' in html
-        assert '<meta property="og:type" content="article">' in html
-        assert (
-            '<meta property="og:url" content="https://example.com/2024/03/01/test.html">'
-            in html
-        )
-        assert '<meta property="og:description" content="A test post for SEO">' in html
-        assert '<meta property="og:site_name" content="Test Blog">' in html
-        assert (
-            '<meta property="og:image" content="https://example.com/cover.jpg">' in html
-        )
+        renderer = TemplateRenderer(templates_dir=templates_dir)
+        before = set(cache_dir.iterdir())
+        renderer.render_template("greeting.html", name="World")
 
-        # Check article-specific Open Graph tags
-        assert '<meta property="article:published_time"' in html
-        assert (
-            '<meta property="article:modified_time" content="2024-03-02T15:30:00+00:00">'
-            in html
-        )
-        assert '<meta property="article:author" content="John Doe">' in html
-        assert '<meta property="article:section" content="testing">' in html
-        assert '<meta property="article:tag" content="seo">' in html
-        assert '<meta property="article:tag" content="meta-tags">' in html
+        assert set(cache_dir.iterdir()) > before
 
-        # Check Twitter Card meta tags
-        assert '<meta name="twitter:card" content="summary_large_image">' in html
-        assert '<meta name="twitter:title" content="SEO Test Post">' in html
-        assert '<meta name="twitter:description" content="A test post for SEO">' in html
-        assert (
-            '<meta name="twitter:image" content="https://example.com/cover.jpg">'
-            in html
-        )
-        assert '<meta name="twitter:creator" content="@johndoe">' in html
-        assert '<meta name="twitter:site" content="@myblog">' in html
+    @pytest.mark.parametrize("fragment", _EXPECTED_SEO_META, ids=_meta_tag_id)
+    def test_render_post_seo_meta_tags(self, seo_post_html: str, fragment: str) -> None:
+        """Test that SEO meta tags are rendered correctly for posts."""
+        assert fragment in seo_post_html
 
     def test_render_post_modified_time_is_iso8601(self) -> None:
         """Test that article:modified_time is ISO 8601 even for non-ISO frontmatter."""
         renderer = TemplateRenderer()
-        post = Post(
-            path=Path("test.md"),
-            title="Test Post",
-            content="Test content",
-            html_content="<p>Test content</p>",
-            date=dt.datetime(2026, 2, 20, 15, 46, 0, tzinfo=dt.UTC),
+        post = dataclasses.replace(
+            _PROTO_POST,
+            date=_DATE_2026_02_20,
             metadata={"modified": "2026-02-21 16:29:00 +0000"},
         )
 
@@ -378,38 +624,36 @@ class TestTemplateRenderer:
     def test_render_post_minimal_meta_tags(self) -> None:
         """Test that posts without optional metadata still render correctly."""
         renderer = TemplateRenderer()
-        post = Post(
-            path=Path("minimal.md"),
-            title="Minimal Post",
-            content="Test content",
-            html_content="<p>Test content</p>",
-            date=dt.datetime(2024, 3, 1, 10, 0, 0, tzinfo=dt.UTC),
-            metadata={},
-        )
-
         html = renderer.render_post(
-            post, site_title="Test Blog", site_url="https://example.com"
+            _MINIMAL_POST, site_title="Test Blog", site_url="https://example.com"
         )
 
         # Should still have basic Open Graph tags
-        assert '<meta property="og:title" content="Minimal Post">' in html
-        assert '<meta property="og:type" content="article">' in html
-
-        # Description should be auto-generated from content
-        assert '<meta name="description" content="Test content">' in html
-        assert '<meta property="og:description" content="Test content">' in html
-        assert '<meta name="twitter:description" content="Test content">' in html
-
+        _assert_all_present(
+            html,
+            (
+                '<meta property="og:title" content="Minimal Post">',
+                '<meta property="og:type" content="article">',
+                # Description should be auto-generated from content
+                '<meta name="description" content="Test content">',
+                '<meta property="og:description" content="Test content">',
+                '<meta name="twitter:description" content="Test content">',
+            ),
+        )
         # Should not have optional tags
-        assert '<meta name="author"' not in html
-        assert '<meta property="og:image"' not in html
+        _assert_none_present(
+            html,
+            (
+                '<meta name="author"',
+                '<meta property="og:image"',
+            ),
+        )
 
     def test_render_post_auto_description_from_content(self) -> None:
         """Test that description is auto-generated from post content."""
         renderer = TemplateRenderer()
-        post = Post(
-            path=Path("test.md"),
-            title="Test Post",
+        post = dataclasses.replace(
+            _PROTO_POST,
             content=(
                 "![Image](cover.jpg)\n\n"
                 "This is the first paragraph with some **bold** text.\n\n"
@@ -420,8 +664,6 @@ class TestTemplateRenderer:
                 "<p>This is the first paragraph with some <strong>bold</strong> text.</p>"
                 "<p>This is the second paragraph.</p>"
             ),
-            date=dt.datetime(2024, 3, 1, 10, 0, 0, tzinfo=dt.UTC),
-            metadata={},
         )
 
         html = renderer.render_post(
@@ -446,7 +688,7 @@ class TestTemplateRenderer:
         """Test that SEO meta tags are rendered correctly for pages."""
         renderer = TemplateRenderer()
         page = Page(
-            path=Path("about.md"),
+            path=_ABOUT_MD_PATH,
             title="About Page",
             content="Test content",
             html_content="<p>Test content</p>",
@@ -462,165 +704,69 @@ class TestTemplateRenderer:
             page, site_title="Test Blog", site_url="https://example.com"
         )
 
-        # Check standard SEO meta tags
-        assert '<meta name="author" content="Jane Smith">' in html
-        assert '<meta name="description" content="About this site">' in html
-
-        # Check Open Graph meta tags
-        assert '<meta property="og:title" content="About Page">' in html
-        assert '<meta property="og:type" content="website">' in html
-        assert (
-            '<meta property="og:url" content="https://example.com/about.html">' in html
-        )
-        assert '<meta property="og:description" content="About this site">' in html
-        assert (
-            '<meta property="og:image" content="https://example.com/page-cover.jpg">'
-            in html
-        )
-
-        # Check Twitter Card meta tags
-        assert '<meta name="twitter:card" content="summary_large_image">' in html
-        assert '<meta name="twitter:title" content="About Page">' in html
-        assert '<meta name="twitter:creator" content="@janesmith">' in html
-
-    def test_render_post_with_relative_cover_absolute_path(self) -> None:
-        """Test that posts with relative cover paths (starting with /) are rendered with site_url."""
-        renderer = TemplateRenderer()
-        post = Post(
-            path=Path("test.md"),
-            title="Test Post",
-            content="Test content",
-            html_content="<p>Test content</p>",
-            date=dt.datetime(2024, 3, 1, 10, 0, 0, tzinfo=dt.UTC),
-            metadata={
-                "cover": "/images/cover.jpg",
-            },
-        )
-
-        html = renderer.render_post(
-            post, site_title="Test Blog", site_url="https://example.com"
-        )
-
-        # Check that site_url is prepended to relative path
-        assert (
-            '<meta property="og:image" content="https://example.com/images/cover.jpg">'
-            in html
-        )
-        assert (
-            '<meta name="twitter:image" content="https://example.com/images/cover.jpg">'
-            in html
-        )
-
-    def test_render_post_with_relative_cover_no_slash(self) -> None:
-        """Test that posts with relative cover paths (no leading /) are rendered with site_url/."""
-        renderer = TemplateRenderer()
-        post = Post(
-            path=Path("test.md"),
-            title="Test Post",
-            content="Test content",
-            html_content="<p>Test content</p>",
-            date=dt.datetime(2024, 3, 1, 10, 0, 0, tzinfo=dt.UTC),
-            metadata={
-                "cover": "images/cover.jpg",
-            },
-        )
-
-        html = renderer.render_post(
-            post, site_title="Test Blog", site_url="https://example.com"
-        )
-
-        # Check that site_url/ is prepended to relative path
-        assert (
-            '<meta property="og:image" content="https://example.com/images/cover.jpg">'
-            in html
-        )
-        assert (
-            '<meta name="twitter:image" content="https://example.com/images/cover.jpg">'
-            in html
-        )
-
-    def test_render_post_with_fully_qualified_cover(self) -> None:
-        """Test that posts with fully-qualified cover URLs are used as-is."""
-        renderer = TemplateRenderer()
-        post = Post(
-            path=Path("test.md"),
-            title="Test Post",
-            content="Test content",
-            html_content="<p>Test content</p>",
-            date=dt.datetime(2024, 3, 1, 10, 0, 0, tzinfo=dt.UTC),
-            metadata={
-                "cover": "https://cdn.example.com/images/cover.jpg",
-            },
-        )
-
-        html = renderer.render_post(
-            post, site_title="Test Blog", site_url="https://example.com"
+        _assert_all_present(
+            html,
+            (
+                # Standard SEO meta tags
+                '<meta name="author" content="Jane Smith">',
+                '<meta name="description" content="About this site">',
+                # Open Graph meta tags
+                '<meta property="og:title" content="About Page">',
+                '<meta property="og:type" content="website">',
+                '<meta property="og:url" content="https://example.com/about.html">',
+                '<meta property="og:description" content="About this site">',
+                '<meta property="og:image" content="https://example.com/page-cover.jpg">',
+                # Twitter Card meta tags
+                '<meta name="twitter:card" content="summary_large_image">',
+                '<meta name="twitter:title" content="About Page">',
+                '<meta name="twitter:creator" content="@janesmith">',
+            ),
         )
 
-        # Check that fully-qualified URL is used as-is
-        assert (
-            '<meta property="og:image" content="https://cdn.example.com/images/cover.jpg">'
-            in html
-        )
-        assert (
-            '<meta name="twitter:image" content="https://cdn.example.com/images/cover.jpg">'
-            in html
+    @pytest.mark.parametrize(
+        ("cover", "expected"),
+        [
+            ("/images/cover.jpg", "https://example.com/images/cover.jpg"),
+            ("images/cover.jpg", "https://example.com/images/cover.jpg"),
+            (
+                "https://cdn.example.com/images/cover.jpg",
+                "https://cdn.example.com/images/cover.jpg",
+            ),
+        ],
+        ids=["relative-absolute-path", "relative-no-slash", "fully-qualified"],
+    )
+    def test_render_post_cover_url_resolution(self, cover: str, expected: str) -> None:
+        """Test that relative cover paths are resolved against site_url, full URLs kept."""
+        _assert_all_present(
+            _render_post_with_cover(cover),
+            (
+                f'<meta property="og:image" content="{expected}">',
+                f'<meta name="twitter:image" content="{expected}">',
+            ),
         )
 
     def test_render_post_defaults_og_image_to_platform_icon(self) -> None:
         """Test that posts without a cover default to the platform icon for og:image."""
-        renderer = TemplateRenderer()
-        post = Post(
-            path=Path("test.md"),
-            title="Test Post",
-            content="Test content",
-            html_content="<p>Test content</p>",
-            date=dt.datetime(2024, 3, 1, 10, 0, 0, tzinfo=dt.UTC),
-            metadata={},
-        )
-
-        html = renderer.render_post(
-            post,
-            site_title="Test Blog",
-            site_url="https://example.com",
-            has_platform_icons=True,
-        )
-
-        assert (
-            '<meta property="og:image" content="https://example.com/icons/android-chrome-512x512.png">'
-            in html
-        )
-        assert (
-            '<meta name="twitter:image" content="https://example.com/icons/android-chrome-512x512.png">'
-            in html
+        _assert_all_present(
+            _render_post_with_cover(None, has_platform_icons=True),
+            (
+                '<meta property="og:image" content="https://example.com/icons/android-chrome-512x512.png">',
+                '<meta name="twitter:image" content="https://example.com/icons/android-chrome-512x512.png">',
+            ),
         )
 
     def test_render_post_cover_takes_priority_over_platform_icon(self) -> None:
         """Test that an explicit cover URL takes priority over the platform icon default."""
-        renderer = TemplateRenderer()
-        post = Post(
-            path=Path("test.md"),
-            title="Test Post",
-            content="Test content",
-            html_content="<p>Test content</p>",
-            date=dt.datetime(2024, 3, 1, 10, 0, 0, tzinfo=dt.UTC),
-            metadata={"cover": "https://example.com/custom-cover.jpg"},
-        )
-
-        html = renderer.render_post(
-            post,
-            site_title="Test Blog",
-            site_url="https://example.com",
-            has_platform_icons=True,
+        html = _render_post_with_cover(
+            "https://example.com/custom-cover.jpg", has_platform_icons=True
         )
 
-        assert (
-            '<meta property="og:image" content="https://example.com/custom-cover.jpg">'
-            in html
-        )
-        assert (
-            '<meta name="twitter:image" content="https://example.com/custom-cover.jpg">'
-            in html
+        _assert_all_present(
+            html,
+            (
+                '<meta property="og:image" content="https://example.com/custom-cover.jpg">',
+                '<meta name="twitter:image" content="https://example.com/custom-cover.jpg">',
+            ),
         )
         assert "android-chrome-512x512.png" not in html
 
@@ -630,88 +776,74 @@ class TestTemplateRenderer:
         assert renderer.site_url == "https://example.com"
         assert renderer.site_domain == "example.com"
 
-    def test_is_external_link_absolute_external(self) -> None:
+    def test_is_external_link_absolute_external(
+        self, renderer_with_site_url: TemplateRenderer
+    ) -> None:
         """Test that absolute external URLs are identified correctly."""
-        renderer = TemplateRenderer(site_url="https://example.com")
-        assert renderer._is_external_link("https://external.com/page")
-        assert renderer._is_external_link("http://external.com/page")
+        assert renderer_with_site_url._is_external_link("https://external.com/page")
+        assert renderer_with_site_url._is_external_link("http://external.com/page")
 
-    def test_is_external_link_relative(self) -> None:
+    def test_is_external_link_relative(
+        self, renderer_with_site_url: TemplateRenderer
+    ) -> None:
         """Test that relative URLs are identified as internal."""
-        renderer = TemplateRenderer(site_url="https://example.com")
-        assert not renderer._is_external_link("/posts/my-post")
-        assert not renderer._is_external_link("posts/my-post")
+        assert not renderer_with_site_url._is_external_link("/posts/my-post")
+        assert not renderer_with_site_url._is_external_link("posts/my-post")
 
-    def test_is_external_link_anchor(self) -> None:
+    def test_is_external_link_anchor(
+        self, renderer_with_site_url: TemplateRenderer
+    ) -> None:
         """Test that anchor links are identified as internal."""
-        renderer = TemplateRenderer(site_url="https://example.com")
-        assert not renderer._is_external_link("#section")
+        assert not renderer_with_site_url._is_external_link("#section")
 
-    def test_is_external_link_same_domain(self) -> None:
+    def test_is_external_link_same_domain(
+        self, renderer_with_site_url: TemplateRenderer
+    ) -> None:
         """Test that links to the same domain are identified as internal."""
-        renderer = TemplateRenderer(site_url="https://example.com")
-        assert not renderer._is_external_link("https://example.com/page")
-        assert not renderer._is_external_link("https://www.example.com/page")
+        assert not renderer_with_site_url._is_external_link("https://example.com/page")
+        assert not renderer_with_site_url._is_external_link(
+            "https://www.example.com/page"
+        )
 
-    def test_is_external_link_no_site_url(self) -> None:
+    def test_is_external_link_no_site_url(
+        self, default_renderer: TemplateRenderer
+    ) -> None:
         """Test external link detection when no site URL is configured."""
-        renderer = TemplateRenderer()
         # With no site URL, all absolute URLs are considered external
-        assert renderer._is_external_link("https://example.com/page")
+        assert default_renderer._is_external_link("https://example.com/page")
         # Relative links are still internal
-        assert not renderer._is_external_link("/page")
+        assert not default_renderer._is_external_link("/page")
 
-    def test_is_external_link_filter_in_template(self) -> None:
+    def test_is_external_link_filter_in_template(
+        self, external_link_template: Template
+    ) -> None:
         """Test that is_external_link filter works in templates."""
-        renderer = TemplateRenderer(site_url="https://example.com")
-        template_str = """
-        {% if "https://github.com"|is_external_link %}external{% else %}internal{% endif %}
-        {% if "/about.html"|is_external_link %}external{% else %}internal{% endif %}
-        """
-        template = renderer.env.from_string(template_str)
-        result = template.render()
+        result = external_link_template.render()
         assert "external" in result
         assert "internal" in result
 
-    def test_render_post_includes_generator_meta_tag(self, sample_post: Post) -> None:
-        """Test that rendered posts include generator meta tag with version."""
-        from blogmore import __version__
-
-        renderer = TemplateRenderer()
-        html = renderer.render_post(
-            sample_post, site_title="Test Blog", blogmore_version=__version__
-        )
-
-        # Check for the generator meta tag with version
-        assert f'<meta name="generator" content="blogmore v{__version__}">' in html
-
-    def test_render_page_includes_generator_meta_tag(self, sample_page: Page) -> None:
-        """Test that rendered pages include generator meta tag with version."""
-        from blogmore import __version__
-
-        renderer = TemplateRenderer()
-        html = renderer.render_page(
-            sample_page, site_title="Test Blog", blogmore_version=__version__
-        )
-
-        # Check for the generator meta tag with version
-        assert f'<meta name="generator" content="blogmore v{__version__}">' in html
-
-    def test_render_index_includes_generator_meta_tag(self, sample_post: Post) -> None:
-        """Test that rendered index includes generator meta tag with version."""
-        from blogmore import __version__
-
-        renderer = TemplateRenderer()
-        html = renderer.render_index(
-            posts=[sample_post],
-            page=1,
-            total_pages=1,
-            site_title="Test Blog",
-            blogmore_version=__version__,
-        )
-
-        # Check for the generator meta tag with version
-        assert f'<meta name="generator" content="blogmore v{__version__}">' in html
+    def test_generator_meta_tag_everywhere(
+        self,
+        default_renderer: TemplateRenderer,
+        sample_post_html: str,
+        sample_post: Post,
+        sample_page: Page,
+    ) -> None:
+        """Test that posts, pages and the index include the generator meta tag."""
+        for html in (
+            sample_post_html,
+            default_renderer.render_page(
+                sample_page, site_title="Test Blog", blogmore_version=__version__
+            ),
+            default_renderer.render_index(
+                posts=[sample_post],
+                page=1,
+                total_pages=1,
+                site_title="Test Blog",
+                blogmore_version=__version__,
+            ),
+        ):
+            assert _GENERATOR_META in html
 
     def test_render_index_og_title(self, sample_post: Post) -> None:
         """Test that the index page includes og:title with site title."""
@@ -827,12 +959,17 @@ class TestTemplateRenderer:
         )
 
         # Should have numbered page links
-        assert 'class="pagination-link pagination-number' in html
-        # Current page should be marked
-        assert "pagination-current" in html
-        # Should have prev and next links
-        assert "pagination-prev" in html
-        assert "pagination-next" in html
+        _assert_all_present(
+            html,
+            (
+                'class="pagination-link pagination-number',
+                # Current page should be marked
+                "pagination-current",
+                # Should have prev and next links
+                "pagination-prev",
+                "pagination-next",
+            ),
+        )
 
     def test_render_index_pagination_appears_at_top_and_bottom(
         self, sample_post: Post
@@ -1209,21 +1346,17 @@ class TestTemplateRenderer:
             canonical_url="https://example.com/tags/python/",
         )
 
-        assert '<meta property="og:type" content="website">' in html
-        assert (
-            '<meta property="og:url" content="https://example.com/tags/python/">'
-            in html
-        )
-        assert '<meta property="og:site_name" content="Test Blog">' in html
-        assert (
-            '<meta property="og:image" content="https://example.com/icons/android-chrome-512x512.png">'
-            in html
-        )
-        assert '<meta name="twitter:card" content="summary_large_image">' in html
-        assert '<meta name="twitter:title" content="Tag: python - Test Blog">' in html
-        assert (
-            '<meta name="twitter:image" content="https://example.com/icons/android-chrome-512x512.png">'
-            in html
+        _assert_all_present(
+            html,
+            (
+                '<meta property="og:type" content="website">',
+                '<meta property="og:url" content="https://example.com/tags/python/">',
+                '<meta property="og:site_name" content="Test Blog">',
+                '<meta property="og:image" content="https://example.com/icons/android-chrome-512x512.png">',
+                '<meta name="twitter:card" content="summary_large_image">',
+                '<meta name="twitter:title" content="Tag: python - Test Blog">',
+                '<meta name="twitter:image" content="https://example.com/icons/android-chrome-512x512.png">',
+            ),
         )
 
     def test_listing_meta_tags_full_social_graph_on_category_page(
@@ -1242,19 +1375,16 @@ class TestTemplateRenderer:
             canonical_url="https://example.com/category/python/",
         )
 
-        assert '<meta property="og:type" content="website">' in html
-        assert (
-            '<meta property="og:url" content="https://example.com/category/python/">'
-            in html
-        )
-        assert '<meta property="og:site_name" content="Test Blog">' in html
-        assert (
-            '<meta property="og:image" content="https://example.com/icons/android-chrome-512x512.png">'
-            in html
-        )
-        assert '<meta name="twitter:card" content="summary_large_image">' in html
-        assert (
-            '<meta name="twitter:title" content="Category: Python - Test Blog">' in html
+        _assert_all_present(
+            html,
+            (
+                '<meta property="og:type" content="website">',
+                '<meta property="og:url" content="https://example.com/category/python/">',
+                '<meta property="og:site_name" content="Test Blog">',
+                '<meta property="og:image" content="https://example.com/icons/android-chrome-512x512.png">',
+                '<meta name="twitter:card" content="summary_large_image">',
+                '<meta name="twitter:title" content="Category: Python - Test Blog">',
+            ),
         )
 
     def test_listing_meta_tags_full_social_graph_on_archive_page(
@@ -1273,15 +1403,17 @@ class TestTemplateRenderer:
             base_path="/2024/01",
         )
 
-        assert '<meta property="og:type" content="website">' in html
-        assert '<meta property="og:url" content="https://example.com/2024/01/">' in html
-        assert '<meta property="og:site_name" content="Test Blog">' in html
-        assert (
-            '<meta property="og:image" content="https://example.com/icons/android-chrome-512x512.png">'
-            in html
+        _assert_all_present(
+            html,
+            (
+                '<meta property="og:type" content="website">',
+                '<meta property="og:url" content="https://example.com/2024/01/">',
+                '<meta property="og:site_name" content="Test Blog">',
+                '<meta property="og:image" content="https://example.com/icons/android-chrome-512x512.png">',
+                '<meta name="twitter:card" content="summary_large_image">',
+                '<meta name="twitter:title" content="January 2024 - Test Blog">',
+            ),
         )
-        assert '<meta name="twitter:card" content="summary_large_image">' in html
-        assert '<meta name="twitter:title" content="January 2024 - Test Blog">' in html
 
     def test_listing_meta_tags_full_social_graph_on_tags_page(self) -> None:
         """Test that the tags cloud page includes full social graph meta tags."""
@@ -1295,16 +1427,18 @@ class TestTemplateRenderer:
             canonical_url="https://example.com/tags/",
         )
 
-        assert '<meta property="og:title" content="All Tags - Test Blog">' in html
-        assert '<meta property="og:type" content="website">' in html
-        assert '<meta property="og:url" content="https://example.com/tags/">' in html
-        assert '<meta property="og:site_name" content="Test Blog">' in html
-        assert (
-            '<meta property="og:image" content="https://example.com/icons/android-chrome-512x512.png">'
-            in html
+        _assert_all_present(
+            html,
+            (
+                '<meta property="og:title" content="All Tags - Test Blog">',
+                '<meta property="og:type" content="website">',
+                '<meta property="og:url" content="https://example.com/tags/">',
+                '<meta property="og:site_name" content="Test Blog">',
+                '<meta property="og:image" content="https://example.com/icons/android-chrome-512x512.png">',
+                '<meta name="twitter:card" content="summary_large_image">',
+                '<meta name="twitter:title" content="All Tags - Test Blog">',
+            ),
         )
-        assert '<meta name="twitter:card" content="summary_large_image">' in html
-        assert '<meta name="twitter:title" content="All Tags - Test Blog">' in html
 
     def test_listing_meta_tags_full_social_graph_on_categories_page(self) -> None:
         """Test that the categories cloud page includes full social graph meta tags."""
@@ -1318,19 +1452,17 @@ class TestTemplateRenderer:
             canonical_url="https://example.com/categories/",
         )
 
-        assert '<meta property="og:title" content="All Categories - Test Blog">' in html
-        assert '<meta property="og:type" content="website">' in html
-        assert (
-            '<meta property="og:url" content="https://example.com/categories/">' in html
-        )
-        assert '<meta property="og:site_name" content="Test Blog">' in html
-        assert (
-            '<meta property="og:image" content="https://example.com/icons/android-chrome-512x512.png">'
-            in html
-        )
-        assert '<meta name="twitter:card" content="summary_large_image">' in html
-        assert (
-            '<meta name="twitter:title" content="All Categories - Test Blog">' in html
+        _assert_all_present(
+            html,
+            (
+                '<meta property="og:title" content="All Categories - Test Blog">',
+                '<meta property="og:type" content="website">',
+                '<meta property="og:url" content="https://example.com/categories/">',
+                '<meta property="og:site_name" content="Test Blog">',
+                '<meta property="og:image" content="https://example.com/icons/android-chrome-512x512.png">',
+                '<meta name="twitter:card" content="summary_large_image">',
+                '<meta name="twitter:title" content="All Categories - Test Blog">',
+            ),
         )
 
     def test_listing_meta_tags_full_social_graph_on_search_page(self) -> None:
@@ -1344,17 +1476,19 @@ class TestTemplateRenderer:
             canonical_url="https://example.com/search/",
         )
 
-        assert '<meta name="robots" content="noindex">' in html
-        assert '<meta property="og:title" content="Search - Test Blog">' in html
-        assert '<meta property="og:type" content="website">' in html
-        assert '<meta property="og:url" content="https://example.com/search/">' in html
-        assert '<meta property="og:site_name" content="Test Blog">' in html
-        assert (
-            '<meta property="og:image" content="https://example.com/icons/android-chrome-512x512.png">'
-            in html
+        _assert_all_present(
+            html,
+            (
+                '<meta name="robots" content="noindex">',
+                '<meta property="og:title" content="Search - Test Blog">',
+                '<meta property="og:type" content="website">',
+                '<meta property="og:url" content="https://example.com/search/">',
+                '<meta property="og:site_name" content="Test Blog">',
+                '<meta property="og:image" content="https://example.com/icons/android-chrome-512x512.png">',
+                '<meta name="twitter:card" content="summary_large_image">',
+                '<meta name="twitter:title" content="Search - Test Blog">',
+            ),
         )
-        assert '<meta name="twitter:card" content="summary_large_image">' in html
-        assert '<meta name="twitter:title" content="Search - Test Blog">' in html
 
     def test_listing_meta_tags_full_social_graph_on_stats_page(self) -> None:
         """Test that the stats page includes full social graph meta tags."""
@@ -1371,19 +1505,17 @@ class TestTemplateRenderer:
             with_read_time=False,
         )
 
-        assert (
-            '<meta property="og:title" content="Blog Statistics - Test Blog">' in html
-        )
-        assert '<meta property="og:type" content="website">' in html
-        assert '<meta property="og:url" content="https://example.com/stats/">' in html
-        assert '<meta property="og:site_name" content="Test Blog">' in html
-        assert (
-            '<meta property="og:image" content="https://example.com/icons/android-chrome-512x512.png">'
-            in html
-        )
-        assert '<meta name="twitter:card" content="summary_large_image">' in html
-        assert (
-            '<meta name="twitter:title" content="Blog Statistics - Test Blog">' in html
+        _assert_all_present(
+            html,
+            (
+                '<meta property="og:title" content="Blog Statistics - Test Blog">',
+                '<meta property="og:type" content="website">',
+                '<meta property="og:url" content="https://example.com/stats/">',
+                '<meta property="og:site_name" content="Test Blog">',
+                '<meta property="og:image" content="https://example.com/icons/android-chrome-512x512.png">',
+                '<meta name="twitter:card" content="summary_large_image">',
+                '<meta name="twitter:title" content="Blog Statistics - Test Blog">',
+            ),
         )
 
     def test_listing_meta_tags_full_social_graph_on_calendar_page(self) -> None:
@@ -1399,18 +1531,18 @@ class TestTemplateRenderer:
             forward_calendar=True,
         )
 
-        assert '<meta property="og:title" content="Calendar - Test Blog">' in html
-        assert '<meta property="og:type" content="website">' in html
-        assert (
-            '<meta property="og:url" content="https://example.com/calendar/">' in html
-        )
-        assert '<meta property="og:site_name" content="Test Blog">' in html
-        assert (
-            '<meta property="og:image" content="https://example.com/icons/android-chrome-512x512.png">'
-            in html
+        _assert_all_present(
+            html,
+            (
+                '<meta property="og:title" content="Calendar - Test Blog">',
+                '<meta property="og:type" content="website">',
+                '<meta property="og:url" content="https://example.com/calendar/">',
+                '<meta property="og:site_name" content="Test Blog">',
+                '<meta property="og:image" content="https://example.com/icons/android-chrome-512x512.png">',
+                '<meta name="twitter:card" content="summary_large_image">',
+                '<meta name="twitter:title" content="Calendar - Test Blog">',
+            ),
         )
-        assert '<meta name="twitter:card" content="summary_large_image">' in html
-        assert '<meta name="twitter:title" content="Calendar - Test Blog">' in html
 
     def test_listing_meta_tags_full_social_graph_on_graph_page(self) -> None:
         """Test that the graph page includes full social graph meta tags."""
@@ -1424,16 +1556,18 @@ class TestTemplateRenderer:
             graph_data_json="{}",
         )
 
-        assert '<meta property="og:title" content="Graph - Test Blog">' in html
-        assert '<meta property="og:type" content="website">' in html
-        assert '<meta property="og:url" content="https://example.com/graph/">' in html
-        assert '<meta property="og:site_name" content="Test Blog">' in html
-        assert (
-            '<meta property="og:image" content="https://example.com/icons/android-chrome-512x512.png">'
-            in html
+        _assert_all_present(
+            html,
+            (
+                '<meta property="og:title" content="Graph - Test Blog">',
+                '<meta property="og:type" content="website">',
+                '<meta property="og:url" content="https://example.com/graph/">',
+                '<meta property="og:site_name" content="Test Blog">',
+                '<meta property="og:image" content="https://example.com/icons/android-chrome-512x512.png">',
+                '<meta name="twitter:card" content="summary_large_image">',
+                '<meta name="twitter:title" content="Graph - Test Blog">',
+            ),
         )
-        assert '<meta name="twitter:card" content="summary_large_image">' in html
-        assert '<meta name="twitter:title" content="Graph - Test Blog">' in html
 
     def test_listing_meta_tags_og_image_from_site_logo(self, sample_post: Post) -> None:
         """Test that listing pages use site_logo as og:image when no platform icons exist."""
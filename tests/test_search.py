@@ -84,7 +84,7 @@ class TestBuildSearchIndex:
         index = build_search_index([post])
         assert len(index) == 1
         entry = index[0]
-        assert set(entry.keys()) == {"title", "url", "date", "content"}
+        assert entry.keys() == {"title", "url", "date", "content"}
 
     def test_title_is_preserved(self) -> None:
         """Entry title matches the post title."""
@@ -167,3 +167,19 @@ class TestWriteSearchIndex:
         assert data[0]["title"] == "My Post"
         assert data[0]["date"] == "2024-06-01"
         assert "Some content" in data[0]["content"]
+
+    def test_file_contains_every_post(self, tmp_path: Path) -> None:
+        """The JSON file holds the index entry of every post, in order."""
+        posts = [
+            Post(
+                path=Path(f"post-{number}.md"),
+                title=f"Post «{number}»",
+                content="Some content",
+                html_content=f"<p>Content of post {number}</p>",
+                draft=False,
+            )
+            for number in range(3)
+        ]
+        write_search_index(posts, tmp_path)
+        data = json.loads((tmp_path / "search_index.json").read_text("utf-8"))
+        assert data == build_search_index(posts)
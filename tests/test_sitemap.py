@@ -1,6 +1,10 @@
 """Unit tests for the sitemap module."""
 
+import os
 from pathlib import Path
+from xml.etree import ElementTree
+
+import pytest
 
 from blogmore.parser import CUSTOM_404_HTML, CUSTOM_404_MARKDOWN
 from blogmore.site_config import SiteConfig
@@ -46,6 +50,20 @@ class TestCollectSitemapUrls:
 
         assert "https://example.com/2024/01/15/my-post.html" in urls
 
+    def test_symlinked_directories_not_followed(self, tmp_path: Path) -> None:
+        """Test that HTML files under a symlinked directory are not collected."""
+        output_dir = tmp_path / "site"
+        output_dir.mkdir()
+        (output_dir / "index.html").write_text("<html/>")
+        elsewhere = tmp_path / "elsewhere"
+        elsewhere.mkdir()
+        (elsewhere / "outside.html").write_text("<html/>")
+        (output_dir / "linked").symlink_to(elsewhere, target_is_directory=True)
+
+        urls = collect_sitemap_urls(output_dir, "https://example.com")
+
+        assert urls == ["https://example.com/index.html"]
+
     def test_uses_fallback_url_when_site_url_empty(self, tmp_path: Path) -> None:
         """Test that fallback URL is used when site_url is empty."""
         (tmp_path / "index.html").write_text("<html/>")
@@ -91,6 +109,19 @@ class TestCollectSitemapUrls:
         assert len(urls) == 1
         assert "https://example.com/index.html" in urls
 
+    def test_html_suffix_matched_with_platform_case(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that the suffix is matched case-insensitively where paths are."""
+        (tmp_path / "PAGE.HTML").write_text("<html/>")
+        assert collect_sitemap_urls(tmp_path, "https://example.com") == []
+
+        # Simulate a case-insensitive platform, such as Windows.
+        monkeypatch.setattr(os.path, "normcase", str.lower)
+        urls = collect_sitemap_urls(tmp_path, "https://example.com")
+
+        assert urls == ["https://example.com/PAGE.HTML"]
+
     def test_clean_urls_strips_index_html_from_nested_paths(
         self, tmp_path: Path
     ) -> None:
@@ -338,6 +369,18 @@ class TestGenerateSitemapXml:
         assert "&amp;" in xml
         assert "https://example.com/page.html?a=1" in xml
 
+    def test_output_parses_back_to_the_urls(self) -> None:
+        """Test that the sitemap is well-formed XML holding every URL."""
+        urls = [
+            "https://example.com/index.html",
+            "https://example.com/page.html?a=1&b=<2>",
+        ]
+
+        root = ElementTree.fromstring(generate_sitemap_xml(urls))
+
+        assert root.tag == f"{{{SITEMAP_XMLNS}}}urlset"
+        assert [loc.text for loc in root.iter(f"{{{SITEMAP_XMLNS}}}loc")] == urls
+
 
 class TestWriteSitemap:
     """Test the write_sitemap function."""
@@ -372,6 +415,19 @@ class TestWriteSitemap:
         assert "search.html" not in content
         assert "https://example.com/index.html" in content
 
+    def test_sitemap_matches_generated_xml(self, tmp_path: Path) -> None:
+        """Test that the written sitemap is the XML generated for the site."""
+        (tmp_path / "index.html").write_text("<html/>")
+        (tmp_path / "about.html").write_text("<html/>")
+
+        expected = generate_sitemap_xml(
+            collect_sitemap_urls(tmp_path, "https://example.com")
+        )
+        write_sitemap(tmp_path, "https://example.com")
+
+        sitemap = (tmp_path / SITEMAP_FILENAME).read_text(encoding="utf-8")
+        assert sitemap == expected
+
     def test_sitemap_written_to_output_root(self, tmp_path: Path) -> None:
         """Test that sitemap.xml is written to the root of the output directory."""
         write_sitemap(tmp_path, "https://example.com")
@@ -425,104 +481,66 @@ class TestWriteSitemap:
         assert content.count("<url>") == 1
 
 
+@pytest.fixture(scope="class")
+def generated_site(
+    request: pytest.FixtureRequest,
+    posts_dir: Path,
+    tmp_path_factory: pytest.TempPathFactory,
+) -> Path:
+    """The fixture posts, generated as a site.
+
+    Parametrized indirectly with a `(with_sitemap, with_search)` tuple. A
+    site is only generated again when the combination changes, so tests
+    that share a combination should sit next to each other.
+    """
+    from blogmore.generator import SiteGenerator
+
+    with_sitemap, with_search = request.param
+    output_dir = tmp_path_factory.mktemp("site")
+    SiteGenerator(
+        site_config=SiteConfig(
+            content_dir=posts_dir,
+            output_dir=output_dir,
+            site_url="https://example.com",
+            with_sitemap=with_sitemap,
+            with_search=with_search,
+        )
+    ).generate()
+    return output_dir
+
+
 class TestSitemapIntegrationWithGenerator:
     """Integration tests for sitemap generation via SiteGenerator."""
 
-    def test_sitemap_not_generated_by_default(
-        self, posts_dir: Path, temp_output_dir: Path
-    ) -> None:
+    @pytest.mark.parametrize("generated_site", [(False, False)], indirect=True)
+    def test_sitemap_not_generated_by_default(self, generated_site: Path) -> None:
         """Test that sitemap.xml is not generated when with_sitemap is False."""
-        from blogmore.generator import SiteGenerator
+        assert not (generated_site / "sitemap.xml").exists()
 
-        generator = SiteGenerator(
-            site_config=SiteConfig(
-                content_dir=posts_dir,
-                output_dir=temp_output_dir,
-                site_url="https://example.com",
-                with_sitemap=False,
-            )
-        )
-        generator.generate()
-
-        assert not (temp_output_dir / "sitemap.xml").exists()
-
-    def test_sitemap_generated_when_enabled(
-        self, posts_dir: Path, temp_output_dir: Path
-    ) -> None:
+    @pytest.mark.parametrize("generated_site", [(True, False)], indirect=True)
+    def test_sitemap_generated_when_enabled(self, generated_site: Path) -> None:
         """Test that sitemap.xml is generated when with_sitemap is True."""
-        from blogmore.generator import SiteGenerator
+        assert (generated_site / "sitemap.xml").exists()
 
-        generator = SiteGenerator(
-            site_config=SiteConfig(
-                content_dir=posts_dir,
-                output_dir=temp_output_dir,
-                site_url="https://example.com",
-                with_sitemap=True,
-            )
-        )
-        generator.generate()
-
-        assert (temp_output_dir / "sitemap.xml").exists()
-
-    def test_sitemap_contains_post_urls(
-        self, posts_dir: Path, temp_output_dir: Path
-    ) -> None:
+    @pytest.mark.parametrize("generated_site", [(True, False)], indirect=True)
+    def test_sitemap_contains_post_urls(self, generated_site: Path) -> None:
         """Test that the sitemap contains post URLs."""
-        from blogmore.generator import SiteGenerator
-
-        generator = SiteGenerator(
-            site_config=SiteConfig(
-                content_dir=posts_dir,
-                output_dir=temp_output_dir,
-                site_url="https://example.com",
-                with_sitemap=True,
-            )
-        )
-        generator.generate()
-
-        content = (temp_output_dir / "sitemap.xml").read_text()
+        content = (generated_site / "sitemap.xml").read_text()
         # The fixture has a post dated 2024-01-15
         assert "https://example.com/2024/01/15/first-post.html" in content
 
-    def test_sitemap_excludes_search_html(
-        self, posts_dir: Path, temp_output_dir: Path
-    ) -> None:
-        """Test that search.html is excluded from the sitemap."""
-        from blogmore.generator import SiteGenerator
-
-        generator = SiteGenerator(
-            site_config=SiteConfig(
-                content_dir=posts_dir,
-                output_dir=temp_output_dir,
-                site_url="https://example.com",
-                with_sitemap=True,
-                with_search=True,
-            )
-        )
-        generator.generate()
-
-        content = (temp_output_dir / "sitemap.xml").read_text()
-        assert "search.html" not in content
-
-    def test_sitemap_contains_index_html(
-        self, posts_dir: Path, temp_output_dir: Path
-    ) -> None:
+    @pytest.mark.parametrize("generated_site", [(True, False)], indirect=True)
+    def test_sitemap_contains_index_html(self, generated_site: Path) -> None:
         """Test that the sitemap contains the index page."""
-        from blogmore.generator import SiteGenerator
-
-        generator = SiteGenerator(
-            site_config=SiteConfig(
-                content_dir=posts_dir,
-                output_dir=temp_output_dir,
-                site_url="https://example.com",
-                with_sitemap=True,
-            )
-        )
-        generator.generate()
-
-        content = (temp_output_dir / "sitemap.xml").read_text()
+        content = (generated_site / "sitemap.xml").read_text()
         assert "https://example.com/index.html" in content
 
+    @pytest.mark.parametrize("generated_site", [(True, True)], indirect=True)
+    def test_sitemap_excludes_search_html(self, generated_site: Path) -> None:
+        """Test that search.html is excluded from the sitemap."""
+        content = (generated_site / "sitemap.xml").read_text()
+        assert "search.html" not in content
+
     def test_sitemap_excludes_404_html(
         self, tmp_path: Path, temp_output_dir: Path
     ) -> None:
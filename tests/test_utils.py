@@ -1,5 +1,7 @@
 """Unit tests for the utils module."""
 
+import pytest
+
 from blogmore.utils import (
     calculate_reading_time_from_html,
     count_words_from_html,
@@ -7,25 +9,80 @@ from blogmore.utils import (
     normalize_site_url,
 )
 
+_BASE_URL = "https://example.com"
+"""The base URL most URLs are made absolute against."""
+
+_WORDS = {count: ("word " * count).rstrip() for count in (200, 250, 350, 400, 1000)}
+"""Runs of words, keyed by how many words are in them."""
+
+_READING_CASES = (
+    ("<p>Hello world</p>", 200, 1),
+    # 400 words at 200 WPM = 2 minutes
+    (f"<p>{_WORDS[400]}</p>", 200, 2),
+    # 1000 words at 200 WPM = 5 minutes
+    (f"<p>{_WORDS[1000]}</p>", 200, 5),
+    # 200 words at 100 WPM = 2 minutes
+    (f"<p>{_WORDS[200]}</p>", 100, 2),
+    # 250 words at 200 WPM = 1.25 minutes, should round to 1
+    (f"<p>{_WORDS[250]}</p>", 200, 1),
+    # 350 words at 200 WPM = 1.75 minutes, should round to 2
+    (f"<p>{_WORDS[350]}</p>", 200, 2),
+    # Content with no words still takes at least 1 minute
+    ("", 200, 1),
+    ("<div><span></span></div>", 200, 1),
+)
+"""Content, reading speed and expected reading time, in minutes."""
+
+
+@pytest.fixture(scope="module", params=[5_000, 50_000], ids=["5k", "50k"])
+def large_html(request: pytest.FixtureRequest) -> tuple[int, str]:
+    """The word count and HTML of a large post with many code blocks.
+
+    Built once per size, for the module.
+    """
+    words: int = request.param
+    return words, (
+        "<p>word</p>\n" * words
+        + "<pre><code>code\nmore code\n</code></pre>\n" * (words // 10)
+    )
+
 
 class TestCalculateReadingTime:
     """Test the calculate_reading_time_from_html function."""
 
-    def test_calculate_reading_time_short_text(self) -> None:
-        """Test that short text returns at least 1 minute."""
-        assert calculate_reading_time_from_html("<p>Hello world</p>") == 1
+    @pytest.mark.parametrize(
+        "content, words_per_minute, expected",
+        _READING_CASES,
+        ids=[
+            "short",
+            "medium",
+            "long",
+            "custom_wpm",
+            "rounds_down",
+            "rounds_up",
+            "empty",
+            "only_tags",
+        ],
+    )
+    def test_calculate_reading_time(
+        self, content: str, words_per_minute: int, expected: int
+    ) -> None:
+        """Test the reading time for content of a known number of words."""
+        assert (
+            calculate_reading_time_from_html(content, words_per_minute=words_per_minute)
+            == expected
+        )
 
-    def test_calculate_reading_time_medium_text(self) -> None:
-        """Test calculating reading time for medium text."""
-        # 400 words at 200 WPM = 2 minutes
-        content = "<p>" + " ".join(["word"] * 400) + "</p>"
-        assert calculate_reading_time_from_html(content) == 2
+    def test_calculate_reading_time_large_content(
+        self, large_html: tuple[int, str]
+    ) -> None:
+        """Test the reading time of a large post with many code blocks.
 
-    def test_calculate_reading_time_long_text(self) -> None:
-        """Test calculating reading time for longer text."""
-        # 1000 words at 200 WPM = 5 minutes
-        content = "<p>" + " ".join(["word"] * 1000) + "</p>"
-        assert calculate_reading_time_from_html(content) == 5
+        This also guards against the word count becoming slow on large
+        posts; compare the durations of the two sizes with `--durations`.
+        """
+        words, content = large_html
+        assert abs(calculate_reading_time_from_html(content) - words // 200) <= 1
 
     def test_calculate_reading_time_with_html_formatting(self) -> None:
         """Test that HTML formatting is stripped before counting."""
@@ -68,31 +125,6 @@ class TestCalculateReadingTime:
         # Should count: "This is a paragraph with HTML tags" = 7 words
         assert calculate_reading_time_from_html(content) == 1
 
-    def test_calculate_reading_time_custom_wpm(self) -> None:
-        """Test using a custom words per minute rate."""
-        # 200 words at 100 WPM = 2 minutes
-        content = "<p>" + " ".join(["word"] * 200) + "</p>"
-        assert calculate_reading_time_from_html(content, words_per_minute=100) == 2
-
-    def test_calculate_reading_time_rounding(self) -> None:
-        """Test that reading time rounds to nearest minute."""
-        # 250 words at 200 WPM = 1.25 minutes, should round to 1
-        content = "<p>" + " ".join(["word"] * 250) + "</p>"
-        assert calculate_reading_time_from_html(content) == 1
-
-        # 350 words at 200 WPM = 1.75 minutes, should round to 2
-        content = "<p>" + " ".join(["word"] * 350) + "</p>"
-        assert calculate_reading_time_from_html(content) == 2
-
-    def test_calculate_reading_time_empty_string(self) -> None:
-        """Test that empty content returns 1 minute."""
-        assert calculate_reading_time_from_html("") == 1
-
-    def test_calculate_reading_time_only_tags(self) -> None:
-        """Test content with only HTML tags."""
-        content = "<div><span></span></div>"
-        assert calculate_reading_time_from_html(content) == 1
-
 
 class TestCountWordsFromHtml:
     """Test the count_words_from_html function."""
@@ -121,100 +153,104 @@ class TestCountWordsFromHtml:
 class TestNormalizeSiteUrl:
     """Test the normalize_site_url function."""
 
-    def test_normalize_no_trailing_slash(self) -> None:
-        """Test normalizing URL without trailing slash."""
-        assert normalize_site_url("https://example.com") == "https://example.com"
-
-    def test_normalize_with_trailing_slash(self) -> None:
-        """Test normalizing URL with trailing slash."""
-        assert normalize_site_url("https://example.com/") == "https://example.com"
-
-    def test_normalize_multiple_trailing_slashes(self) -> None:
-        """Test normalizing URL with multiple trailing slashes."""
-        assert normalize_site_url("https://example.com///") == "https://example.com"
-
-    def test_normalize_empty_string(self) -> None:
-        """Test normalizing empty string."""
-        assert normalize_site_url("") == ""
-
-    def test_normalize_just_slash(self) -> None:
-        """Test normalizing just a slash."""
-        assert normalize_site_url("/") == ""
-
-    def test_normalize_http_url(self) -> None:
-        """Test normalizing HTTP URL with trailing slash."""
-        assert normalize_site_url("http://blog.davep.org/") == "http://blog.davep.org"
-
-    def test_normalize_https_url(self) -> None:
-        """Test normalizing HTTPS URL with trailing slash."""
-        assert normalize_site_url("https://blog.davep.org/") == "https://blog.davep.org"
+    @pytest.mark.parametrize(
+        "site_url, expected",
+        [
+            ("https://example.com", "https://example.com"),
+            ("https://example.com/", "https://example.com"),
+            ("https://example.com///", "https://example.com"),
+            ("", ""),
+            ("/", ""),
+            ("http://blog.davep.org/", "http://blog.davep.org"),
+            ("https://blog.davep.org/", "https://blog.davep.org"),
+        ],
+        ids=[
+            "no_trailing_slash",
+            "trailing_slash",
+            "multiple_trailing_slashes",
+            "empty_string",
+            "just_slash",
+            "http_url",
+            "https_url",
+        ],
+    )
+    def test_normalize_site_url(self, site_url: str, expected: str) -> None:
+        """Test that trailing slashes are removed from a site URL."""
+        assert normalize_site_url(site_url) == expected
 
 
 class TestMakeUrlsAbsolute:
     """Test the make_urls_absolute function."""
 
-    def test_src_double_quotes(self) -> None:
-        """Test that src with double-quoted relative path is rewritten."""
-        html = '<img src="/images/photo.jpg">'
-        result = make_urls_absolute(html, "https://example.com")
-        assert result == '<img src="https://example.com/images/photo.jpg">'
-
-    def test_src_single_quotes(self) -> None:
-        """Test that src with single-quoted relative path is rewritten."""
-        html = "<img src='/images/photo.jpg'>"
-        result = make_urls_absolute(html, "https://example.com")
-        assert result == "<img src='https://example.com/images/photo.jpg'>"
-
-    def test_href_double_quotes(self) -> None:
-        """Test that href with double-quoted relative path is rewritten."""
-        html = '<a href="/about.html">About</a>'
-        result = make_urls_absolute(html, "https://example.com")
-        assert result == '<a href="https://example.com/about.html">About</a>'
-
-    def test_href_single_quotes(self) -> None:
-        """Test that href with single-quoted relative path is rewritten."""
-        html = "<a href='/about.html'>About</a>"
-        result = make_urls_absolute(html, "https://example.com")
-        assert result == "<a href='https://example.com/about.html'>About</a>"
-
-    def test_absolute_urls_unchanged(self) -> None:
-        """Test that existing absolute URLs are not modified."""
-        html = '<img src="https://cdn.example.com/images/photo.jpg">'
-        result = make_urls_absolute(html, "https://example.com")
-        assert result == html
-
-    def test_absolute_http_urls_unchanged(self) -> None:
-        """Test that existing absolute HTTP URLs are not modified."""
-        html = '<a href="http://external.com/page.html">link</a>'
-        result = make_urls_absolute(html, "https://example.com")
-        assert result == html
-
-    def test_multiple_attributes_in_one_call(self) -> None:
-        """Test that multiple relative attributes are all rewritten."""
-        html = '<img src="/img/banner.png"><a href="/posts/hello.html">Hello</a>'
-        result = make_urls_absolute(html, "https://example.com")
-        assert 'src="https://example.com/img/banner.png"' in result
-        assert 'href="https://example.com/posts/hello.html"' in result
-
-    def test_trailing_slash_stripped_from_base_url(self) -> None:
-        """Test that a trailing slash on base_url does not produce double slashes."""
-        html = '<img src="/img/photo.jpg">'
-        result = make_urls_absolute(html, "https://example.com/")
-        assert result == '<img src="https://example.com/img/photo.jpg">'
-
-    def test_deeply_nested_path(self) -> None:
-        """Test rewriting a deeply nested root-relative path."""
-        html = '<img src="/attachments/2026/02/11/banner.png">'
-        result = make_urls_absolute(html, "https://myblog.com")
-        assert (
-            result == '<img src="https://myblog.com/attachments/2026/02/11/banner.png">'
-        )
-
-    def test_no_relative_urls_returns_unchanged(self) -> None:
-        """Test that HTML with no relative URLs is returned unchanged."""
-        html = "<p>Hello world</p>"
-        result = make_urls_absolute(html, "https://example.com")
-        assert result == html
+    @pytest.mark.parametrize(
+        "html, base_url, expected",
+        [
+            (
+                '<img src="/images/photo.jpg">',
+                _BASE_URL,
+                '<img src="https://example.com/images/photo.jpg">',
+            ),
+            (
+                "<img src='/images/photo.jpg'>",
+                _BASE_URL,
+                "<img src='https://example.com/images/photo.jpg'>",
+            ),
+            (
+                '<a href="/about.html">About</a>',
+                _BASE_URL,
+                '<a href="https://example.com/about.html">About</a>',
+            ),
+            (
+                "<a href='/about.html'>About</a>",
+                _BASE_URL,
+                "<a href='https://example.com/about.html'>About</a>",
+            ),
+            # Existing absolute URLs are not modified
+            (
+                '<img src="https://cdn.example.com/images/photo.jpg">',
+                _BASE_URL,
+                '<img src="https://cdn.example.com/images/photo.jpg">',
+            ),
+            (
+                '<a href="http://external.com/page.html">link</a>',
+                _BASE_URL,
+                '<a href="http://external.com/page.html">link</a>',
+            ),
+            (
+                '<img src="/img/banner.png"><a href="/posts/hello.html">Hello</a>',
+                _BASE_URL,
+                '<img src="https://example.com/img/banner.png">'
+                '<a href="https://example.com/posts/hello.html">Hello</a>',
+            ),
+            # A trailing slash on the base URL doesn't produce double slashes
+            (
+                '<img src="/img/photo.jpg">',
+                f"{_BASE_URL}/",
+                '<img src="https://example.com/img/photo.jpg">',
+            ),
+            (
+                '<img src="/attachments/2026/02/11/banner.png">',
+                "https://myblog.com",
+                '<img src="https://myblog.com/attachments/2026/02/11/banner.png">',
+            ),
+            ("<p>Hello world</p>", _BASE_URL, "<p>Hello world</p>"),
+        ],
+        ids=[
+            "src_double_quotes",
+            "src_single_quotes",
+            "href_double_quotes",
+            "href_single_quotes",
+            "absolute_urls_unchanged",
+            "absolute_http_urls_unchanged",
+            "multiple_attributes_in_one_call",
+            "trailing_slash_stripped_from_base_url",
+            "deeply_nested_path",
+            "no_relative_urls_returns_unchanged",
+        ],
+    )
+    def test_make_urls_absolute(self, html: str, base_url: str, expected: str) -> None:
+        """Test that root-relative URLs, and only those, are made absolute."""
+        assert make_urls_absolute(html, base_url) == expected
 
 
 ### test_utils.py ends here